@@ -1,21 +1,22 @@
 from __future__ import annotations
 
 import re
-from typing import List
+from typing import IO, List, Union
 import pdfplumber
 from docx import Document as DocxDocument
 
 
-def read_pdf_text(path: str) -> str:
+def read_pdf_text(path: Union[str, IO[bytes]]) -> str:
     chunks: List[str] = []
     with pdfplumber.open(path) as pdf:
         for p in pdf.pages:
             txt = p.extract_text() or ""
             chunks.append(txt)
+            p.close()
     return "\n".join(chunks)
 
 
-def read_docx_text(path: str) -> str:
+def read_docx_text(path: Union[str, IO[bytes]]) -> str:
     doc = DocxDocument(path)
     chunks: List[str] = []
     auto_num = 1
@@ -147,9 +148,9 @@ def _extract_amended_claims_from_text(raw_text: str) -> str:
     return claims_block
 
 
-def extract_amended_claims_from_pdf(path: str) -> str:
+def extract_amended_claims_from_pdf(path: Union[str, IO[bytes]]) -> str:
     return _extract_amended_claims_from_text(read_pdf_text(path))
 
 
-def extract_amended_claims_from_docx(path: str) -> str:
+def extract_amended_claims_from_docx(path: Union[str, IO[bytes]]) -> str:
     return _extract_amended_claims_from_text(read_docx_text(path))
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import re
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass
-from typing import Dict, List, Tuple
+from typing import IO, Dict, Iterator, List, Optional, Tuple, Union
 
 import pdfplumber
 from docx import Document as DocxDocument
@@ -39,15 +40,106 @@ class FerParseResult:
     objections: List[Objection] = None
 
 
-def read_pdf_text(path: str) -> str:
+class PdfSource:
+    """A PDF (path or binary stream) opened once with pdfplumber; page text and tables
+    are extracted on first use.
+
+    The PDF extractors below accept either a path or an open ``PdfSource``, so a request
+    that runs several extractors over the same file parses it only once.
+    """
+
+    def __init__(self, path: Union[str, IO[bytes]]):
+        self.path = path
+        self._pdf = pdfplumber.open(path)
+        self._page_texts: Dict[int, str] = {}
+        self._page_tables: Dict[int, List] = {}
+        self._page_clean_tables: Dict[int, List[List[List[str]]]] = {}
+        self._text: Optional[str] = None
+
+    @property
+    def page_count(self) -> int:
+        return len(self._pdf.pages)
+
+    # Each page is closed once its result is cached, so pdfplumber's per-page layout
+    # objects are freed instead of piling up until the whole source is closed.
+    def page_text(self, index: int) -> str:
+        if index not in self._page_texts:
+            page = self._pdf.pages[index]
+            self._page_texts[index] = page.extract_text() or ""
+            page.close()
+        return self._page_texts[index]
+
+    def page_tables(self, index: int) -> List:
+        if index not in self._page_tables:
+            page = self._pdf.pages[index]
+            self._page_tables[index] = page.extract_tables() or []
+            page.close()
+        return self._page_tables[index]
+
+    def page_clean_tables(self, index: int) -> List[List[List[str]]]:
+        """Tables on the page with cells passed through _clean_table_cell and empty rows dropped."""
+        if index not in self._page_clean_tables:
+            self._page_clean_tables[index] = [
+                [[_clean_table_cell(c) for c in row] for row in table or [] if row]
+                for table in self.page_tables(index)
+            ]
+        return self._page_clean_tables[index]
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = "\n".join(self.page_text(i) for i in range(self.page_count))
+        return self._text
+
+    def close(self) -> None:
+        self._pdf.close()
+
+    def __enter__(self) -> "PdfSource":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class DocxSource:
+    """A DOCX whose flattened text is read once and shared by the DOCX extractors."""
+
+    def __init__(self, path: Union[str, IO[bytes]]):
+        self.path = path
+        self._text: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = read_docx_text(self.path)
+        return self._text
+
+
+@contextmanager
+def _pdf_source(src: Union[str, PdfSource]) -> Iterator[PdfSource]:
+    if isinstance(src, PdfSource):
+        yield src
+    else:
+        with PdfSource(src) as opened:
+            yield opened
+
+
+def read_pdf_text(path: Union[str, PdfSource]) -> str:
+    if isinstance(path, PdfSource):
+        return path.text
     chunks: List[str] = []
     with pdfplumber.open(path) as pdf:
         for p in pdf.pages:
             chunks.append(p.extract_text() or "")
+            # Drop the page's parsed layout objects once its text is read; otherwise
+            # pdfplumber keeps every page's char objects alive until the PDF closes.
+            p.close()
     return "\n".join(chunks)
 
 
-def read_docx_text(path: str) -> str:
+def read_docx_text(path: Union[str, DocxSource]) -> str:
+    if isinstance(path, DocxSource):
+        return path.text
     chunks: List[str] = []
     doc = DocxDocument(path)
     for p in doc.paragraphs:
@@ -61,14 +153,21 @@ def read_docx_text(path: str) -> str:
     return "\n".join(chunks)
 
 
-def _clean(text: str) -> str:
+def _strip_extraction_noise(text: str) -> str:
     t = (text or "").replace("\u00ad", "")
-    t = re.sub(r"\(cid:\d+\)", "", t)
+    return re.sub(r"\(cid:\d+\)", "", t)
+
+
+def _collapse_blank_space(t: str) -> str:
     t = re.sub(r"[ \t]+", " ", t)
     t = re.sub(r"\n{3,}", "\n\n", t)
     return t.strip()
 
 
+def _clean(text: str) -> str:
+    return _collapse_blank_space(_strip_extraction_noise(text))
+
+
 def _first_match(pattern: str, text: str, flags: int = 0) -> str:
     m = re.search(pattern, text, flags)
     return m.group(1).strip() if m else ""
@@ -232,71 +331,64 @@ def _extract_applicant_from_labeled_block(text: str) -> str:
     return candidate
 
 
-def _extract_applicant_from_cs_tables(path: str) -> str:
+def _extract_applicant_from_cs_tables(src: PdfSource) -> str:
     try:
-        with pdfplumber.open(path) as pdf:
-            for page in pdf.pages[:5]:
-                tables = page.extract_tables() or []
-                for table in tables:
-                    cleaned_rows = []
-                    for row in table or []:
-                        if not row:
-                            continue
-                        cleaned_rows.append([_clean_table_cell(c) for c in row])
-                    if not cleaned_rows:
-                        continue
+        for page_idx in range(min(5, src.page_count)):
+            for cleaned_rows in src.page_clean_tables(page_idx):
+                if not cleaned_rows:
+                    continue
 
-                    for row in cleaned_rows:
-                        row_text = " | ".join([c for c in row if c])
-                        m_app = re.search(
-                            r"(?is)\bApplicant(?:s|\(\s*s\s*\))?\s*[:\-]?\s*(.+?)(?:\bNationality\b|\bAddress\b|$)",
-                            row_text,
-                            re.I,
-                        )
-                        if m_app:
-                            raw_name = re.sub(r"\s+", " ", m_app.group(1)).strip(" ,;:-|")
-                            if re.fullmatch(r"(?i)(name|nationality|address|indian|applicant(?:s|\(\s*s\s*\))?)", raw_name):
-                                raw_name = ""
-                            if raw_name:
-                                candidate = _pick_best_applicant_name(raw_name)
-                                if candidate and re.search(r"[A-Za-z]", candidate):
-                                    return candidate
-
-                        m = re.search(r"(?is)\bName\s*[:\-]?\s*(.+?)(?:\bNationality\b|$)", row_text, re.I)
-                        if m:
-                            raw_name = re.sub(r"\s+", " ", m.group(1)).strip(" ,;:-")
-                            if re.fullmatch(r"(?i)(name|nationality|address|indian)", raw_name):
-                                continue
+                for row in cleaned_rows:
+                    row_text = " | ".join([c for c in row if c])
+                    m_app = re.search(
+                        r"(?is)\bApplicant(?:s|\(\s*s\s*\))?\s*[:\-]?\s*(.+?)(?:\bNationality\b|\bAddress\b|$)",
+                        row_text,
+                        re.I,
+                    )
+                    if m_app:
+                        raw_name = re.sub(r"\s+", " ", m_app.group(1)).strip(" ,;:-|")
+                        if re.fullmatch(r"(?i)(name|nationality|address|indian|applicant(?:s|\(\s*s\s*\))?)", raw_name):
+                            raw_name = ""
+                        if raw_name:
                             candidate = _pick_best_applicant_name(raw_name)
                             if candidate and re.search(r"[A-Za-z]", candidate):
                                 return candidate
 
-                        for i, cell in enumerate(row):
-                            key = (cell or "").strip()
-                            if re.fullmatch(r"(?i)applicant(?:s|\(\s*s\s*\))?\s*:?", key):
-                                if i + 1 >= len(row):
-                                    continue
-                                raw_name = re.sub(r"\s+", " ", row[i + 1]).strip(" ,;:-|")
-                                if not raw_name:
-                                    continue
-                                if re.fullmatch(r"(?i)(name|nationality|address|indian|applicant(?:s|\(\s*s\s*\))?)", raw_name):
-                                    continue
-                                candidate = _pick_best_applicant_name(raw_name)
-                                if candidate and re.search(r"[A-Za-z]", candidate):
-                                    return candidate
-
-                            if not re.fullmatch(r"(?i)name|name\s*:", (cell or "").strip()):
-                                continue
+                    m = re.search(r"(?is)\bName\s*[:\-]?\s*(.+?)(?:\bNationality\b|$)", row_text, re.I)
+                    if m:
+                        raw_name = re.sub(r"\s+", " ", m.group(1)).strip(" ,;:-")
+                        if re.fullmatch(r"(?i)(name|nationality|address|indian)", raw_name):
+                            continue
+                        candidate = _pick_best_applicant_name(raw_name)
+                        if candidate and re.search(r"[A-Za-z]", candidate):
+                            return candidate
+
+                    for i, cell in enumerate(row):
+                        key = (cell or "").strip()
+                        if re.fullmatch(r"(?i)applicant(?:s|\(\s*s\s*\))?\s*:?", key):
                             if i + 1 >= len(row):
                                 continue
-                            raw_name = re.sub(r"\s+", " ", row[i + 1]).strip(" ,;:-")
+                            raw_name = re.sub(r"\s+", " ", row[i + 1]).strip(" ,;:-|")
                             if not raw_name:
                                 continue
-                            if re.fullmatch(r"(?i)(name|nationality|address|indian)", raw_name):
+                            if re.fullmatch(r"(?i)(name|nationality|address|indian|applicant(?:s|\(\s*s\s*\))?)", raw_name):
                                 continue
                             candidate = _pick_best_applicant_name(raw_name)
                             if candidate and re.search(r"[A-Za-z]", candidate):
                                 return candidate
+
+                        if not re.fullmatch(r"(?i)name|name\s*:", (cell or "").strip()):
+                            continue
+                        if i + 1 >= len(row):
+                            continue
+                        raw_name = re.sub(r"\s+", " ", row[i + 1]).strip(" ,;:-")
+                        if not raw_name:
+                            continue
+                        if re.fullmatch(r"(?i)(name|nationality|address|indian)", raw_name):
+                            continue
+                        candidate = _pick_best_applicant_name(raw_name)
+                        if candidate and re.search(r"[A-Za-z]", candidate):
+                            return candidate
     except Exception:
         return ""
 
@@ -567,44 +659,37 @@ def _extract_meta(text: str) -> Dict[str, str]:
     }
 
 
-def extract_detailed_observations_block(text: str) -> str:
-    t = _clean(text)
-    for sp in [
-        r"B\.\s*Detailed\s+observations\s+on\s+the\s+requirements\s+under\s+the\s+Act",
-        r"Detailed\s+observations\s+on\s+the\s+requirements\s+under\s+the\s+Act",
-    ]:
-        m = re.search(sp, t, re.I)
+_DETAILED_OBS_START_PATTERNS = [
+    re.compile(r"B\.\s*Detailed\s+observations\s+on\s+the\s+requirements\s+under\s+the\s+Act", re.I),
+    re.compile(r"Detailed\s+observations\s+on\s+the\s+requirements\s+under\s+the\s+Act", re.I),
+]
+# "PART-III: FORMAL" always starts where "PART-III" does, so the leftmost match of this
+# alternation is the earliest of the section's possible end markers.
+_RE_DETAILED_OBS_END = re.compile(r"PART\s*[-–]\s*III|FORMAL\s+REQUIREMENTS", re.I)
+
+_FORMAL_REQS_START_PATTERNS = [
+    re.compile(r"PART\s*[-–]\s*III\s*[:\-]\s*FORMAL\s+REQUIREMENTS", re.I | re.M),
+    re.compile(r"PART\s*[-–]\s*III[^\n]{0,100}FORMAL\s+REQUIREMENTS", re.I | re.M),
+    re.compile(r"(?m)^\s*FORMAL\s+REQUIREMENTS\s*$", re.I | re.M),
+]
+_RE_FORMAL_REQS_END = re.compile(r"PART\s*[-–]\s*IV|DOCUMENTS\s+ON\s+RECORD", re.I)
+
+
+def _detailed_observations_from_clean(t: str) -> str:
+    for sp in _DETAILED_OBS_START_PATTERNS:
+        m = sp.search(t)
         if not m:
             continue
-        start_idx = m.start()
-        tail = t[start_idx:]
-        end_idx = len(tail)
-        for ep in [
-            r"PART\s*[-–]\s*III\s*[:\-]\s*FORMAL",
-            r"PART\s*[-–]\s*III",
-            r"FORMAL\s+REQUIREMENTS",
-        ]:
-            m2 = re.search(ep, tail, re.I)
-            if m2:
-                end_idx = min(end_idx, m2.start())
-        return tail[:end_idx].strip()
+        tail = t[m.start():]
+        m2 = _RE_DETAILED_OBS_END.search(tail)
+        return tail[:m2.start() if m2 else len(tail)].strip()
     return ""
 
 
-def extract_formal_requirements_block(text: str) -> str:
-    """Extract raw PART-III formal-requirements text from FER."""
-    # Keep raw line layout for table fidelity; only remove hard extraction noise.
-    t = (text or "").replace("\u00ad", "")
-    t = re.sub(r"\(cid:\d+\)", "", t)
+def _formal_requirements_from_stripped(t: str) -> str:
     starts = []
-
-    start_patterns = [
-        r"PART\s*[-–]\s*III\s*[:\-]\s*FORMAL\s+REQUIREMENTS",
-        r"PART\s*[-–]\s*III[^\n]{0,100}FORMAL\s+REQUIREMENTS",
-        r"(?m)^\s*FORMAL\s+REQUIREMENTS\s*$",
-    ]
-    for pat in start_patterns:
-        starts.extend(list(re.finditer(pat, t, re.I | re.MULTILINE)))
+    for pat in _FORMAL_REQS_START_PATTERNS:
+        starts.extend(pat.finditer(t))
 
     if not starts:
         return ""
@@ -613,13 +698,30 @@ def extract_formal_requirements_block(text: str) -> str:
     start_match = max(starts, key=lambda m: m.start())
     tail = t[start_match.end():]
 
-    end_idx = len(tail)
-    for ep in [r"PART\s*[-–]\s*IV", r"DOCUMENTS\s+ON\s+RECORD"]:
-        m2 = re.search(ep, tail, re.I)
-        if m2:
-            end_idx = min(end_idx, m2.start())
+    m2 = _RE_FORMAL_REQS_END.search(tail)
+    return tail[:m2.start() if m2 else len(tail)].strip()
+
+
+def extract_detailed_observations_block(text: str) -> str:
+    return _detailed_observations_from_clean(_clean(text))
+
+
+def extract_formal_requirements_block(text: str) -> str:
+    """Extract raw PART-III formal-requirements text from FER."""
+    # Keep raw line layout for table fidelity; only remove hard extraction noise.
+    return _formal_requirements_from_stripped(_strip_extraction_noise(text))
 
-    return tail[:end_idx].strip()
+
+def extract_fer_sections(text: str) -> Dict[str, str]:
+    """
+    Split FER text into the detailed-observations and formal-requirements blocks,
+    stripping extraction noise once for both.
+    """
+    stripped = _strip_extraction_noise(text)
+    return {
+        "detailed_obs": _detailed_observations_from_clean(_collapse_blank_space(stripped)),
+        "formal_reqs": _formal_requirements_from_stripped(stripped),
+    }
 
 
 def _clean_table_cell(cell: str) -> str:
@@ -633,7 +735,22 @@ def _clean_table_cell(cell: str) -> str:
     return "\n".join(lines).strip()
 
 
-def extract_formal_requirements_rows_from_pdf(path: str) -> List[Tuple[str, str]]:
+_RE_FORMAL_ROWS_START = re.compile(r"PART\s*[-–]?\s*III[^\n]{0,100}FORMAL\s+REQUIREMENTS", re.I)
+_RE_FORMAL_ROWS_END = re.compile(r"PART\s*[-–]?\s*IV|DOCUMENTS\s+ON\s+RECORD", re.I)
+_RE_NON_FORMAL_TABLE = re.compile(r"docket|entry number|publication date|sl\.?no", re.I)
+_RE_OBJECTIONS_WORD = re.compile(r"\bobjections?\b", re.I)
+_RE_REMARKS_WORD = re.compile(r"\bremarks?\b", re.I)
+_RE_FORMAL_OBJECTION_HINT = re.compile(
+    r"\b(Form\s*\d+|Power\s+of\s+Attorney|Format\s+of|Other\s+Deficiencies|"
+    r"Applicable\s+fee|Endorsement|Date\s+and\s+Signature|Statement\s*&\s*Under\s*Taking|"
+    r"Statement\s*&\s*Undertaking)\b",
+    re.I,
+)
+_RE_PATENT_OFFICE_LINE = re.compile(r"^THE\s+PATENT\s+OFFICE$", re.I)
+_RE_PAGE_OF_LINE = re.compile(r"^Page\s+\d+\s+of\s+\d+$", re.I)
+
+
+def extract_formal_requirements_rows_from_pdf(path: Union[str, PdfSource]) -> List[Tuple[str, str]]:
     """
     Extract formal requirements as row pairs: (Objection, Remark)
     from PART-III table in FER PDF.
@@ -641,36 +758,30 @@ def extract_formal_requirements_rows_from_pdf(path: str) -> List[Tuple[str, str]
     rows: List[Tuple[str, str]] = []
     stop_scan = False
 
-    with pdfplumber.open(path) as pdf:
+    with _pdf_source(path) as src:
         in_formal = False
         seen_header = False
 
-        for page in pdf.pages:
+        for page_idx in range(src.page_count):
             if stop_scan:
                 break
-            page_text = page.extract_text() or ""
+            page_text = src.page_text(page_idx)
 
             if not in_formal:
-                if re.search(r"PART\s*[-–]?\s*III[^\n]{0,100}FORMAL\s+REQUIREMENTS", page_text, re.I):
+                if _RE_FORMAL_ROWS_START.search(page_text):
                     in_formal = True
                 else:
                     continue
 
-            tables = page.extract_tables() or []
-            for table in tables:
+            for cleaned_rows in src.page_clean_tables(page_idx):
                 if stop_scan:
                     break
-                cleaned_rows = []
-                for row in table or []:
-                    if not row:
-                        continue
-                    cleaned_rows.append([_clean_table_cell(c) for c in row])
                 if not cleaned_rows:
                     continue
 
                 # Skip obvious non-formal tables such as docket/document lists.
                 head_text = " ".join(" ".join(r).lower() for r in cleaned_rows[:3])
-                if re.search(r"docket|entry number|publication date|sl\.?no", head_text, re.I):
+                if _RE_NON_FORMAL_TABLE.search(head_text):
                     continue
 
                 ob_idx = rem_idx = None
@@ -679,8 +790,8 @@ def extract_formal_requirements_rows_from_pdf(path: str) -> List[Tuple[str, str]
                 # "Objections" and "Remarks" in one cell before the actual header row.
                 # Treat a row as header only when both labels appear in different cells.
                 for ridx, row in enumerate(cleaned_rows[:8]):
-                    ob_cols = [idx for idx, val in enumerate(row) if re.search(r"\bobjections?\b", val, re.I)]
-                    rem_cols = [idx for idx, val in enumerate(row) if re.search(r"\bremarks?\b", val, re.I)]
+                    ob_cols = [idx for idx, val in enumerate(row) if _RE_OBJECTIONS_WORD.search(val)]
+                    rem_cols = [idx for idx, val in enumerate(row) if _RE_REMARKS_WORD.search(val)]
                     chosen = None
                     for oi in ob_cols:
                         for ri in rem_cols:
@@ -700,13 +811,7 @@ def extract_formal_requirements_rows_from_pdf(path: str) -> List[Tuple[str, str]
                 if ob_idx is None or rem_idx is None:
                     if not seen_header:
                         continue
-                    objection_hint = re.search(
-                        r"\b(Form\s*\d+|Power\s+of\s+Attorney|Format\s+of|Other\s+Deficiencies|"
-                        r"Applicable\s+fee|Endorsement|Date\s+and\s+Signature|Statement\s*&\s*Under\s*Taking|"
-                        r"Statement\s*&\s*Undertaking)\b",
-                        " ".join(" ".join(r) for r in cleaned_rows),
-                        re.I,
-                    )
+                    objection_hint = _RE_FORMAL_OBJECTION_HINT.search(" ".join(" ".join(r) for r in cleaned_rows))
                     if not objection_hint:
                         continue
 
@@ -760,22 +865,22 @@ def extract_formal_requirements_rows_from_pdf(path: str) -> List[Tuple[str, str]
 
                     if not ob and not rem:
                         continue
-                    if re.search(r"\bobjections?\b", combined, re.I) and re.search(r"\bremarks?\b", combined, re.I):
+                    if _RE_OBJECTIONS_WORD.search(combined) and _RE_REMARKS_WORD.search(combined):
                         continue
-                    if re.fullmatch(r"Page", rem, re.I):
+                    if rem.lower() == "page":
                         continue
-                    if re.search(r"^THE\s+PATENT\s+OFFICE$", rem, re.I) and not ob:
+                    if _RE_PATENT_OFFICE_LINE.search(rem) and not ob:
                         continue
-                    if re.search(r"^THE\s+PATENT\s+OFFICE$", ob, re.I) and re.search(r"^THE\s+PATENT\s+OFFICE$", rem, re.I):
+                    if _RE_PATENT_OFFICE_LINE.search(ob) and _RE_PATENT_OFFICE_LINE.search(rem):
                         continue
-                    if re.search(r"^Page\s+\d+\s+of\s+\d+$", ob, re.I) or re.search(r"^Page\s+\d+\s+of\s+\d+$", rem, re.I):
+                    if _RE_PAGE_OF_LINE.search(ob) or _RE_PAGE_OF_LINE.search(rem):
                         continue
-                    if re.search(r"^THE\s+PATENT\s+OFFICE$", ob, re.I) and not rem:
+                    if _RE_PATENT_OFFICE_LINE.search(ob) and not rem:
                         continue
 
                     combined = f"{ob} {rem}".strip()
-                    if re.search(r"PART\s*[-–]?\s*IV|DOCUMENTS\s+ON\s+RECORD", combined, re.I):
-                        part_split = re.split(r"PART\s*[-–]?\s*IV|DOCUMENTS\s+ON\s+RECORD", rem, maxsplit=1, flags=re.I)
+                    if _RE_FORMAL_ROWS_END.search(combined):
+                        part_split = _RE_FORMAL_ROWS_END.split(rem, maxsplit=1)
                         rem_before = part_split[0].strip() if part_split else ""
                         if rem_before and rows:
                             prev_ob, prev_rem = rows[-1]
@@ -795,7 +900,7 @@ def extract_formal_requirements_rows_from_pdf(path: str) -> List[Tuple[str, str]
 
             if stop_scan:
                 break
-            if in_formal and re.search(r"PART\s*[-–]?\s*IV|DOCUMENTS\s+ON\s+RECORD", page_text, re.I):
+            if in_formal and _RE_FORMAL_ROWS_END.search(page_text):
                 break
 
     cleaned_pairs: List[Tuple[str, str]] = []
@@ -904,13 +1009,12 @@ def _sections_from_text(body: str) -> List[str]:
     return sorted(secs)
 
 
-def extract_title_from_cs_pdf(path: str) -> str:
-    raw = read_pdf_text(path)
-    if not raw:
-        return ""
+def extract_title_from_cs_pdf(path: Union[str, PdfSource]) -> str:
+    with _pdf_source(path) as src:
+        return _extract_title_from_cs_source(src)
 
-    lines = [ln.strip() for ln in raw.splitlines()]
 
+def _extract_title_from_cs_source(src: PdfSource) -> str:
     def _clean_title_line(s: str) -> str:
         x = (s or "").strip()
         x = re.sub(r"\(cid:\d+\)", "", x)
@@ -926,41 +1030,40 @@ def extract_title_from_cs_pdf(path: str) -> str:
         re.I,
     )
 
-    # Prefer explicit key-value title rows from CS tables when present.
+    # Prefer explicit key-value title rows from CS tables when present; these only need
+    # the cover-sheet pages, so the full-document text is read only when they miss.
     try:
-        with pdfplumber.open(path) as pdf:
-            for page in pdf.pages[:5]:
-                tables = page.extract_tables() or []
-                for table in tables:
-                    cleaned_rows = []
-                    for row in table or []:
-                        if not row:
-                            continue
-                        cleaned_rows.append([_clean_table_cell(c) for c in row])
-                    for row in cleaned_rows:
-                        if not row:
+        for page_idx in range(min(5, src.page_count)):
+            for cleaned_rows in src.page_clean_tables(page_idx):
+                for row in cleaned_rows:
+                    if not row:
+                        continue
+                    for ci, cell in enumerate(row):
+                        c = (cell or "").strip()
+                        if not c:
                             continue
-                        for ci, cell in enumerate(row):
-                            c = (cell or "").strip()
-                            if not c:
-                                continue
-                            m_inline = re.search(r"(?is)\bTitle\s*[:\-]\s*(.+)$", c, re.I)
-                            if m_inline:
-                                cand = _clean_title_line(m_inline.group(1))
-                                if cand and not stop_pat.search(cand):
-                                    return cand
-
-                            if not re.fullmatch(r"(?i)title\s*:?", c):
-                                continue
-                            others = [x for j, x in enumerate(row) if j != ci and (x or "").strip()]
-                            if not others:
-                                continue
-                            cand = _clean_title_line(" ".join(others))
+                        m_inline = re.search(r"(?is)\bTitle\s*[:\-]\s*(.+)$", c, re.I)
+                        if m_inline:
+                            cand = _clean_title_line(m_inline.group(1))
                             if cand and not stop_pat.search(cand):
                                 return cand
+
+                        if not re.fullmatch(r"(?i)title\s*:?", c):
+                            continue
+                        others = [x for j, x in enumerate(row) if j != ci and (x or "").strip()]
+                        if not others:
+                            continue
+                        cand = _clean_title_line(" ".join(others))
+                        if cand and not stop_pat.search(cand):
+                            return cand
     except Exception:
         pass
 
+    raw = src.text
+    if not raw:
+        return ""
+
+    lines = [ln.strip() for ln in raw.splitlines()]
     for i, ln in enumerate(lines):
         if not re.search(r"\bTITLE\s+OF\s+THE\s+INVENTION\b", ln, re.I):
             continue
@@ -997,7 +1100,7 @@ def extract_title_from_cs_pdf(path: str) -> str:
     return ""
 
 
-def extract_title_from_cs_docx(path: str) -> str:
+def extract_title_from_cs_docx(path: Union[str, DocxSource]) -> str:
     raw = read_docx_text(path)
     if not raw:
         return ""
@@ -1055,8 +1158,13 @@ def extract_title_from_cs_docx(path: str) -> str:
     return ""
 
 
-def extract_applicant_from_cs_pdf(path: str) -> str:
-    raw = read_pdf_text(path)
+def extract_applicant_from_cs_pdf(path: Union[str, PdfSource]) -> str:
+    with _pdf_source(path) as src:
+        return _extract_applicant_from_cs_source(src)
+
+
+def _extract_applicant_from_cs_source(src: PdfSource) -> str:
+    raw = src.text
     if not raw:
         return ""
 
@@ -1064,7 +1172,6 @@ def extract_applicant_from_cs_pdf(path: str) -> str:
     if by_label:
         return by_label
 
-    t = _clean(raw)
     lines = [ln.strip() for ln in raw.splitlines()]
     start = None
 
@@ -1108,16 +1215,16 @@ def extract_applicant_from_cs_pdf(path: str) -> str:
         if candidate:
             return candidate
 
-    by_table = _extract_applicant_from_cs_tables(path)
+    by_table = _extract_applicant_from_cs_tables(src)
     if by_table:
         return by_table
 
-    fallback = _extract_applicant_from_text(t)
+    fallback = _extract_applicant_from_text(_clean(raw))
     candidate = _pick_best_applicant_name(fallback)
     return candidate
 
 
-def extract_applicant_from_cs_docx(path: str) -> str:
+def extract_applicant_from_cs_docx(path: Union[str, DocxSource]) -> str:
     raw = read_docx_text(path)
     if not raw:
         return ""
@@ -1406,23 +1513,23 @@ def _extract_cs_technical_effect_from_text(text: str) -> str:
     return "\n\n".join(out).strip()
 
 
-def extract_cs_background_and_summary(path: str) -> Tuple[str, str]:
+def extract_cs_background_and_summary(path: Union[str, PdfSource]) -> Tuple[str, str]:
     return _extract_cs_background_and_summary_from_text(read_pdf_text(path) or "")
 
 
-def extract_cs_background_and_summary_from_docx(path: str) -> Tuple[str, str]:
+def extract_cs_background_and_summary_from_docx(path: Union[str, DocxSource]) -> Tuple[str, str]:
     return _extract_cs_background_and_summary_from_text(read_docx_text(path) or "")
 
 
-def extract_cs_technical_effect(path: str) -> str:
+def extract_cs_technical_effect(path: Union[str, PdfSource]) -> str:
     return _extract_cs_technical_effect_from_text(read_pdf_text(path) or "")
 
 
-def extract_cs_technical_effect_from_docx(path: str) -> str:
+def extract_cs_technical_effect_from_docx(path: Union[str, DocxSource]) -> str:
     return _extract_cs_technical_effect_from_text(read_docx_text(path) or "")
 
 
-def parse_fer_pdf(path: str) -> FerParseResult:
+def parse_fer_pdf(path: Union[str, PdfSource]) -> FerParseResult:
     raw = read_pdf_text(path)
     text = _clean(raw)
 
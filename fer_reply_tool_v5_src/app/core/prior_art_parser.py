@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import re
-from typing import List
+from typing import IO, Dict, List, Tuple, Union
 
 import pdfplumber
 from docx import Document as DocxDocument
@@ -20,14 +20,122 @@ _STOP_HEADINGS = re.compile(
 )
 
 
+_RE_WS_RUN = re.compile(r"\s+")
+_RE_HSPACE_RUN = re.compile(r"[ \t]{2,}")
+_RE_ASCII_LETTER = re.compile(r"[A-Za-z]")
+_RE_INLINE_LINE_NUMBER = re.compile(r"(?<=[A-Za-z])\s+\d{1,2}\s+(?=[a-z])")
+
+# Applied in order by clean_prior_art_text before the text is split into lines.
+_CLEAN_TEXT_SUBS = [
+    (re.compile(r"\(cid:\d+\)"), ""),
+    (re.compile(r"https?://\S+|www\.\S+", re.I), ""),
+    (
+        re.compile(
+            r"\b\d{1,2}/\d{1,2}/\d{2,4},?\s+\d{1,2}:\d{2}\s*(?:AM|PM)\s+Espacenet\s*[–-]\s*search\s+results\b",
+            re.I,
+        ),
+        " ",
+    ),
+    (re.compile(r"\bEspacenet\s*[–-]\s*search\s+results\b", re.I), " "),
+    (re.compile(r"\bsearch\s+results\b", re.I), " "),
+    (re.compile(r"\bRelated\s+U\s*\.?\s*S\s*\.?\s+Application\s+Data\b", re.I), " "),
+    (re.compile(r"\(\s*Continued\s*\)", re.I), " "),
+    (re.compile(r"\(\s*51\s*\)\s*Int\s*\.?\s*Cl\s*\.?", re.I), " "),
+    (re.compile(r"\bInt\s*\.?\s*Cl\s*\.?\b", re.I), " "),
+    (re.compile(r"\bPat\s*\.?\s*No\s*\.?\s*[\d,]+\b", re.I), " "),
+    (
+        re.compile(
+            r"\b[A-Za-z]{3,9}\.?\s*\d{1,2}\s*,?\s*\d{4}\s*,?\s*now\s*Pat\s*\.?\s*No\s*\.?\s*[\d,]+\s*,?\s*which\s+is\s+a\b",
+            re.I,
+        ),
+        " ",
+    ),
+    (
+        re.compile(r"\b[A-Za-z]{3,9}\.?\s*\d{1,2}\s*,?\s*\d{4}\s*,?\s*now\s*,?\s*which\s+is\s+a\b", re.I),
+        " ",
+    ),
+    (re.compile(r"(\w)-\s*\n\s*(\w)"), r"\1\2"),
+]
+
+# Applied in order by _strip_inline_metadata; each match is replaced with a space.
+_INLINE_METADATA_PATTERNS = [
+    re.compile(r"\bRelated\s+U\.?S\.?\s+Application\s+Data\b", re.I),
+    re.compile(r"\(\s*Continued\s*\)", re.I),
+    re.compile(r"\(\s*51\s*\)\s*Int\s*\.?\s*Cl\s*\.?", re.I),
+    re.compile(r"\bInt\s*\.?\s*Cl\s*\.?\b", re.I),
+    re.compile(r"\bU\.?S\.?\s*Cl\.?\b", re.I),
+    re.compile(r"\bPat\s*\.?\s*No\s*\.?\s*[\d,]+\b", re.I),
+    re.compile(r"\bUS\s*\d{4}/\d{6,}\s*[A-Z]\d?\s*[A-Za-z]{3}\.?\s*\d{1,2}\s*,?\s*\d{4}\b", re.I),
+    re.compile(
+        r"\b[A-Za-z]{3,9}\.?\s*\d{1,2}\s*,?\s*\d{4}\s*,?\s*now\s*Pat\s*\.?\s*No\s*\.?\s*[\d,]+\s*,?\s*which\s+is\s+a\b",
+        re.I,
+    ),
+    re.compile(r"\b[A-Za-z]{3,9}\.?\s*\d{1,2}\s*,?\s*\d{4}\s*,?\s*now\s*,?\s*which\s+is\s+a\b", re.I),
+    re.compile(r"\(\s*\d{2}\s*\)\s*(?:U\.?S\.?\s*)?Cl\.?", re.I),
+]
+
+# Noise lines: any of these found anywhere in the line (case-insensitive) ...
+_RE_NOISE_SEARCH = re.compile(
+    "|".join(
+        [
+            r"\bsearch\s+results\b",
+            r"\bEspacenet\b",
+            r"https?://|www\.|espacenet\.com",
+            r"\b\d{1,2}:\d{2}\s*(?:AM|PM)\b",
+            r"\bDocument\s+generated\s+on\b",
+            r"\b(?:application|pub(?:lication)?|priority)\s*(?:no\.?|number|date)\b",
+            r"\bkind\s+code\b",
+            r"\brelated\s+u\.?s\.?\s+application\s+data\b",
+            r"\bint\.?\s*cl\.?\b",
+            r"\bU\.?\s*S\.?\s*C\s*I\.?\b",
+            r"\(\s*continued\s*\)",
+            r"\bpat\.?\s*no\.?\s*[\d,]+\b",
+        ]
+    ),
+    re.I,
+)
+
+# ... or the whole line matching one of these shapes.
+_RE_NOISE_FULL = re.compile(
+    "|".join(
+        "(?:%s)" % p
+        for p in [
+            r"(?i:Page\s+\d+\s+of\s+\d+)",
+            r"\[\d{1,4}\]",
+            r"\d{1,4}",
+            r"[A-Z]{1,3}\d{5,}[A-Z0-9]*",
+            r"\d{2,4}[/-]\d{2}[/-]\d{2,4}",
+            r"\d{4}[/-]\d{1,2}[/-]\d{1,2}",
+            r"\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}",
+            r"(?i:THE\s+PATENT\s+OFFICE)",
+            r"\(\s*\d[\d\s]{1,8}\.\d{2}\s*\)",
+            r"(?i:\(\s*\d+\s*\)\s*U\.?\s*S\.?\s*C\.?\s*I\.?)",
+            r"(?i:\(\s*\d+\s*\)\s*U\.?\s*S\.?\s*Cl\.?)",
+            r"(?i:[A-HY]\d{2}[A-Z]?\s*\d+(?:\.\d+)?/\d+(?:\.\d+)?)",
+            r"(?i:[A-HY]\d{2}[A-Z]?\s*\d+(?:\.\d+)?/\d+(?:\.\d+)?\s*\(\s*\d{4}\.\d{2}\s*\))",
+            r"(?i:(?:[A-HY]\d{2}[A-Z]?\s*\d+(?:\.\d+)?/\d+(?:\.\d+)?(?:\s*\(\s*\d[\d\s]{1,8}\.\d{2}\s*\))?\s*;?\s*){1,4})",
+            r"(?i:\(\s*\d[\d\s]{1,8}\.\d{2}\s*\)\s*;\s*[A-HY]\d{2}[A-Z]?\s*\d+(?:\.\d+)?/\d+(?:\.\d+)?(?:\s*\(\s*\d[\d\s]{1,8}\.\d{2}\s*\))?\s*;?)",
+            r"(?i:CPC)",
+            r"(?i:\d+\s+Claims?\s*,\s*\d+\s+Drawing\s+Sheets?)",
+            r"(?:[A-Z]{1,3}\s+)?\d{1,3}(?:[,\s]\d{3})+(?:\s+[A-Z]\d?)?",
+        ]
+    )
+)
+
+_RE_ABSTRACT_HEADING = re.compile(
+    r"^(?:\[\d{1,3}\]\s*)?abstract(?:\s+of\s+the\s+disclosure)?\b\s*[:\-]?\s*(.*)$",
+    re.I,
+)
+
+
 def normalize_prior_art_label(label: str, index: int) -> str:
     raw = (label or "").strip().upper()
-    if re.fullmatch(r"D\d{1,3}", raw):
+    if 2 <= len(raw) <= 4 and raw[0] == "D" and raw[1:].isdecimal():
         return raw
     return f"D{index}"
 
 
-def read_docx_text(path: str) -> str:
+def read_docx_text(path: Union[str, IO[bytes]]) -> str:
     chunks: List[str] = []
     doc = DocxDocument(path)
     for p in doc.paragraphs:
@@ -41,38 +149,54 @@ def read_docx_text(path: str) -> str:
     return "\n".join(chunks)
 
 
-def is_scanned_prior_art_pdf(path: str, sample_pages: int = 10) -> bool:
+def is_scanned_prior_art_pdf(path: Union[str, IO[bytes]], sample_pages: int = 10) -> bool:
     """
     True only when sampled pages have no usable text layer (image-only scan).
     PDFs with OCR/text layer should return False and continue with normal extraction.
     """
     try:
         with pdfplumber.open(path) as pdf:
-            total_pages = len(pdf.pages)
-            if total_pages <= 0:
-                return True
-
-            page_indices = _sample_page_indices(total_pages, sample_pages)
-            nonempty_pages = 0
-            alnum_chars = 0
-
-            for idx in page_indices:
-                txt = (pdf.pages[idx].extract_text() or "").strip()
-                if not txt:
-                    continue
-                nonempty_pages += 1
-                alnum_chars += len(re.findall(r"[A-Za-z0-9]", txt))
-
-            if nonempty_pages == 0:
-                return True
-            if nonempty_pages == 1 and alnum_chars < 90 and total_pages >= 3:
-                return True
-            return False
+            return _is_scanned_pages(pdf.pages, {}, sample_pages)
     except Exception:
         # Fall back to existing extraction behavior on parser errors.
         return False
 
 
+def _page_text(pages, index: int, cache: Dict[int, str]) -> str:
+    if index not in cache:
+        page = pages[index]
+        cache[index] = page.extract_text() or ""
+        page.close()
+    return cache[index]
+
+
+def _is_scanned_pages(pages, texts: Dict[int, str], sample_pages: int = 10) -> bool:
+    total_pages = len(pages)
+    if total_pages <= 0:
+        return True
+
+    page_indices = _sample_page_indices(total_pages, sample_pages)
+    nonempty_pages = 0
+    alnum_chars = 0
+
+    for idx in page_indices:
+        txt = _page_text(pages, idx, texts).strip()
+        if not txt:
+            continue
+        nonempty_pages += 1
+        alnum_chars += len(re.findall(r"[A-Za-z0-9]", txt))
+        # The verdict below can only be "scanned" with at most one short text page, so a
+        # normal text PDF is settled after its first one or two text pages.
+        if nonempty_pages >= 2 or alnum_chars >= 90 or total_pages < 3:
+            return False
+
+    if nonempty_pages == 0:
+        return True
+    if nonempty_pages == 1 and alnum_chars < 90 and total_pages >= 3:
+        return True
+    return False
+
+
 def _sample_page_indices(total_pages: int, sample_pages: int) -> List[int]:
     count = max(1, min(sample_pages, total_pages))
     if total_pages <= count:
@@ -88,34 +212,8 @@ def _sample_page_indices(total_pages: int, sample_pages: int) -> List[int]:
 
 def clean_prior_art_text(text: str) -> str:
     t = (text or "").replace("\u00ad", "")
-    t = re.sub(r"\(cid:\d+\)", "", t)
-    t = re.sub(r"https?://\S+|www\.\S+", "", t, flags=re.I)
-    t = re.sub(
-        r"\b\d{1,2}/\d{1,2}/\d{2,4},?\s+\d{1,2}:\d{2}\s*(?:AM|PM)\s+Espacenet\s*[–-]\s*search\s+results\b",
-        " ",
-        t,
-        flags=re.I,
-    )
-    t = re.sub(r"\bEspacenet\s*[–-]\s*search\s+results\b", " ", t, flags=re.I)
-    t = re.sub(r"\bsearch\s+results\b", " ", t, flags=re.I)
-    t = re.sub(r"\bRelated\s+U\s*\.?\s*S\s*\.?\s+Application\s+Data\b", " ", t, flags=re.I)
-    t = re.sub(r"\(\s*Continued\s*\)", " ", t, flags=re.I)
-    t = re.sub(r"\(\s*51\s*\)\s*Int\s*\.?\s*Cl\s*\.?", " ", t, flags=re.I)
-    t = re.sub(r"\bInt\s*\.?\s*Cl\s*\.?\b", " ", t, flags=re.I)
-    t = re.sub(r"\bPat\s*\.?\s*No\s*\.?\s*[\d,]+\b", " ", t, flags=re.I)
-    t = re.sub(
-        r"\b[A-Za-z]{3,9}\.?\s*\d{1,2}\s*,?\s*\d{4}\s*,?\s*now\s*Pat\s*\.?\s*No\s*\.?\s*[\d,]+\s*,?\s*which\s+is\s+a\b",
-        " ",
-        t,
-        flags=re.I,
-    )
-    t = re.sub(
-        r"\b[A-Za-z]{3,9}\.?\s*\d{1,2}\s*,?\s*\d{4}\s*,?\s*now\s*,?\s*which\s+is\s+a\b",
-        " ",
-        t,
-        flags=re.I,
-    )
-    t = re.sub(r"(\w)-\s*\n\s*(\w)", r"\1\2", t)
+    for pattern, repl in _CLEAN_TEXT_SUBS:
+        t = pattern.sub(repl, t)
 
     lines: List[str] = []
     for raw_line in t.splitlines():
@@ -141,123 +239,34 @@ def clean_prior_art_text(text: str) -> str:
         paragraphs.append(" ".join(cur).strip())
 
     cleaned = "\n\n".join(p for p in paragraphs if p)
-    cleaned = re.sub(r"[ \t]{2,}", " ", cleaned).strip()
+    cleaned = _RE_HSPACE_RUN.sub(" ", cleaned).strip()
     cleaned = _polish_abstract_tail(cleaned)
     return cleaned
 
 
 def _normalize_line(line: str) -> str:
     s = (line or "").strip()
-    s = re.sub(r"\s+", " ", s)
+    s = _RE_WS_RUN.sub(" ", s)
     s = _strip_inline_metadata(s)
-    s = re.sub(r"(?<=[A-Za-z])\s+\d{1,2}\s+(?=[a-z])", " ", s)
-    s = re.sub(r"\s+", " ", s)
+    s = _RE_INLINE_LINE_NUMBER.sub(" ", s)
+    s = _RE_WS_RUN.sub(" ", s)
     return s.strip(" \t")
 
 
 def _strip_inline_metadata(line: str) -> str:
     s = line or ""
-    s = re.sub(r"\bRelated\s+U\.?S\.?\s+Application\s+Data\b", " ", s, flags=re.I)
-    s = re.sub(r"\(\s*Continued\s*\)", " ", s, flags=re.I)
-    s = re.sub(r"\(\s*51\s*\)\s*Int\s*\.?\s*Cl\s*\.?", " ", s, flags=re.I)
-    s = re.sub(r"\bInt\s*\.?\s*Cl\s*\.?\b", " ", s, flags=re.I)
-    s = re.sub(r"\bU\.?S\.?\s*Cl\.?\b", " ", s, flags=re.I)
-    s = re.sub(r"\bPat\s*\.?\s*No\s*\.?\s*[\d,]+\b", " ", s, flags=re.I)
-    s = re.sub(
-        r"\bUS\s*\d{4}/\d{6,}\s*[A-Z]\d?\s*[A-Za-z]{3}\.?\s*\d{1,2}\s*,?\s*\d{4}\b",
-        " ",
-        s,
-        flags=re.I,
-    )
-    s = re.sub(
-        r"\b[A-Za-z]{3,9}\.?\s*\d{1,2}\s*,?\s*\d{4}\s*,?\s*now\s*Pat\s*\.?\s*No\s*\.?\s*[\d,]+\s*,?\s*which\s+is\s+a\b",
-        " ",
-        s,
-        flags=re.I,
-    )
-    s = re.sub(
-        r"\b[A-Za-z]{3,9}\.?\s*\d{1,2}\s*,?\s*\d{4}\s*,?\s*now\s*,?\s*which\s+is\s+a\b",
-        " ",
-        s,
-        flags=re.I,
-    )
-    s = re.sub(r"\(\s*\d{2}\s*\)\s*(?:U\.?S\.?\s*)?Cl\.?", " ", s, flags=re.I)
-    return re.sub(r"\s+", " ", s).strip()
+    for pattern in _INLINE_METADATA_PATTERNS:
+        s = pattern.sub(" ", s)
+    return _RE_WS_RUN.sub(" ", s).strip()
 
 
 def _is_noise_line(line: str) -> bool:
     s = (line or "").strip()
     if not s:
         return True
-    if re.search(r"\bsearch\s+results\b", s, re.I):
-        return True
-    if re.search(r"\bEspacenet\b", s, re.I):
-        return True
-    if re.search(r"https?://|www\.|espacenet\.com", s, re.I):
-        return True
-    if re.fullmatch(r"Page\s+\d+\s+of\s+\d+", s, re.I):
-        return True
-    if re.fullmatch(r"\[\d{1,4}\]", s):
-        return True
-    if re.fullmatch(r"\d{1,4}", s):
-        return True
-    if re.fullmatch(r"[A-Z]{1,3}\d{5,}[A-Z0-9]*", s):
-        return True
-    if re.fullmatch(r"\d{2,4}[/-]\d{2}[/-]\d{2,4}", s):
-        return True
-    if re.fullmatch(r"\d{4}[/-]\d{1,2}[/-]\d{1,2}", s):
-        return True
-    if re.fullmatch(r"\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}", s):
-        return True
-    if re.search(r"\b\d{1,2}:\d{2}\s*(?:AM|PM)\b", s, re.I):
-        return True
-    if re.fullmatch(r"THE\s+PATENT\s+OFFICE", s, re.I):
-        return True
-    if re.search(r"\bDocument\s+generated\s+on\b", s, re.I):
-        return True
-    if re.search(r"\b(?:application|pub(?:lication)?|priority)\s*(?:no\.?|number|date)\b", s, re.I):
-        return True
-    if re.search(r"\bkind\s+code\b", s, re.I):
-        return True
-    if re.search(r"\brelated\s+u\.?s\.?\s+application\s+data\b", s, re.I):
-        return True
-    if re.search(r"\bint\.?\s*cl\.?\b", s, re.I):
-        return True
-    if re.search(r"\bU\.?\s*S\.?\s*C\s*I\.?\b", s, re.I):
+    if _RE_NOISE_SEARCH.search(s) or _RE_NOISE_FULL.fullmatch(s):
         return True
-    if re.fullmatch(r"\(\s*\d[\d\s]{1,8}\.\d{2}\s*\)", s):
-        return True
-    if re.fullmatch(r"\(\s*\d+\s*\)\s*U\.?\s*S\.?\s*C\.?\s*I\.?", s, re.I):
-        return True
-    if re.fullmatch(r"\(\s*\d+\s*\)\s*U\.?\s*S\.?\s*Cl\.?", s, re.I):
-        return True
-    if re.fullmatch(r"[A-HY]\d{2}[A-Z]?\s*\d+(?:\.\d+)?/\d+(?:\.\d+)?", s, re.I):
-        return True
-    if re.fullmatch(r"[A-HY]\d{2}[A-Z]?\s*\d+(?:\.\d+)?/\d+(?:\.\d+)?\s*\(\s*\d{4}\.\d{2}\s*\)", s, re.I):
-        return True
-    if re.fullmatch(
-        r"(?:[A-HY]\d{2}[A-Z]?\s*\d+(?:\.\d+)?/\d+(?:\.\d+)?(?:\s*\(\s*\d[\d\s]{1,8}\.\d{2}\s*\))?\s*;?\s*){1,4}",
-        s,
-        re.I,
-    ):
-        return True
-    if re.fullmatch(
-        r"\(\s*\d[\d\s]{1,8}\.\d{2}\s*\)\s*;\s*[A-HY]\d{2}[A-Z]?\s*\d+(?:\.\d+)?/\d+(?:\.\d+)?(?:\s*\(\s*\d[\d\s]{1,8}\.\d{2}\s*\))?\s*;?",
-        s,
-        re.I,
-    ):
-        return True
-    if re.fullmatch(r"CPC", s, re.I):
-        return True
-    if re.fullmatch(r"\d+\s+Claims?\s*,\s*\d+\s+Drawing\s+Sheets?", s, re.I):
-        return True
-    if re.search(r"\(\s*continued\s*\)", s, re.I):
-        return True
-    if re.search(r"\bpat\.?\s*no\.?\s*[\d,]+\b", s, re.I):
-        return True
-    if re.fullmatch(r"(?:[A-Z]{1,3}\s+)?\d{1,3}(?:[,\s]\d{3})+(?:\s+[A-Z]\d?)?", s):
-        return True
-    if len(re.findall(r"[A-Za-z]", s)) < 2 and len(s) < 8:
+    if len(s) < 8 and len(_RE_ASCII_LETTER.findall(s)) < 2:
         return True
     return False
 
@@ -313,7 +322,7 @@ def _looks_like_claim_start(line: str) -> bool:
 
 def _trim_words(text: str, max_words: int = _MAX_ABSTRACT_WORDS) -> str:
     raw = re.sub(r"\s+", " ", (text or "")).strip()
-    words = re.findall(r"\S+", raw)
+    words = raw.split()
     if len(words) <= max_words:
         return raw
 
@@ -424,13 +433,9 @@ def _collect_candidate(lines: List[str], start_idx: int, inline_text: str = "")
 
 
 def _extract_heading_based(lines: List[str]) -> str:
-    abs_pat = re.compile(
-        r"^(?:\[\d{1,3}\]\s*)?abstract(?:\s+of\s+the\s+disclosure)?\b\s*[:\-]?\s*(.*)$",
-        re.I,
-    )
     candidates: List[str] = []
     for i, line in enumerate(lines):
-        m = abs_pat.match(line)
+        m = _RE_ABSTRACT_HEADING.match(line)
         if m:
             abstract = _collect_candidate(lines, i + 1, inline_text=m.group(1))
             if len(abstract.split()) >= 15:
@@ -560,13 +565,33 @@ def _extract_prior_art_abstract_from_text(raw_text: str) -> str:
     return clean_prior_art_text(abstract)
 
 
-def extract_prior_art_abstract_from_pdf(path: str) -> str:
+def extract_prior_art_abstract_from_pdf(path: Union[str, IO[bytes]]) -> str:
     page_texts: List[str] = []
     with pdfplumber.open(path) as pdf:
         for page in pdf.pages:
             page_texts.append(page.extract_text() or "")
+            page.close()
     return _extract_prior_art_abstract_from_text("\n\n".join(page_texts))
 
 
-def extract_prior_art_abstract_from_docx(path: str) -> str:
+def scan_and_extract_prior_art_pdf(path: Union[str, IO[bytes]]) -> Tuple[bool, str]:
+    """
+    Return (is_scanned, abstract) from a single pass over the PDF. Pages sampled by
+    the scanned-copy check are not extracted again for the abstract; scanned copies
+    return an empty abstract.
+    """
+    with pdfplumber.open(path) as pdf:
+        pages = pdf.pages
+        texts: Dict[int, str] = {}
+        try:
+            scanned = _is_scanned_pages(pages, texts)
+        except Exception:
+            scanned = False
+        if scanned:
+            return True, ""
+        page_texts = [_page_text(pages, i, texts) for i in range(len(pages))]
+    return False, _extract_prior_art_abstract_from_text("\n\n".join(page_texts))
+
+
+def extract_prior_art_abstract_from_docx(path: Union[str, IO[bytes]]) -> str:
     return _extract_prior_art_abstract_from_text(read_docx_text(path))
@@ -1,14 +1,23 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import re
-from typing import Dict, List, Optional, Tuple
+import sys
+from copy import deepcopy
+from dataclasses import dataclass
+from itertools import groupby
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
 
 from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_BREAK
+from docx.oxml.ns import qn
+from docx.oxml.text.paragraph import CT_P
 from docx.shared import Inches, Pt, RGBColor
+from docx.table import _Cell
+from docx.text.run import Run
 
-from .fer_parser import FerParseResult
+from .fer_parser import FerParseResult, Objection
 
 
 def _para(
@@ -100,31 +109,89 @@ def _gap(doc: Document, pts: int = 6) -> None:
     doc.add_paragraph().paragraph_format.space_after = Pt(pts)
 
 
-def _iter_cell_paragraphs(cell):
-    for p in cell.paragraphs:
-        yield p
-    for nested in cell.tables:
-        for row in nested.rows:
-            for c in row.cells:
-                yield from _iter_cell_paragraphs(c)
+_BULK_PARAGRAPH_BUILDERS = {
+    "gap2": lambda doc: _gap(doc, 2),
+    "gap4": lambda doc: _gap(doc, 4),
+    "gap6": lambda doc: _gap(doc, 6),
+    "gap8": lambda doc: _gap(doc, 8),
+    "gap10": lambda doc: _gap(doc, 10),
+    "para": lambda doc: _para(doc, "-"),
+    "bold": lambda doc: _para(doc, "-", bold=True),
+    "placeholder": lambda doc: _placeholder(doc, "-"),
+    "heading": lambda doc: _heading(doc, "-"),
+    "reply_label": _reply_label,
+}
+_BULK_PARAGRAPH_PROTOTYPES: Dict[str, CT_P] = {}
+
+# Gap sentinels for spec lists that otherwise hold plain paragraph text.
+_GAP4 = ("", "gap4")
+_GAP6 = ("", "gap6")
+_GAP8 = ("", "gap8")
+
+
+def _emit_paragraphs_bulk(doc: Document, specs: List[Tuple[str, str]]) -> None:
+    """Append ``(text, style_key)`` paragraphs to the body in a single splice.
+
+    Each style key is rendered once through its regular helper and then cloned,
+    so the emitted XML matches the per-call helpers exactly. The helpers produce
+    no document-specific markup, so the rendered prototypes are kept for reuse.
+    """
+    if not specs:
+        return
+    body = doc.element.body
+
+    for _, key in specs:
+        if key not in _BULK_PARAGRAPH_PROTOTYPES:
+            _BULK_PARAGRAPH_BUILDERS[key](doc)
+            proto = body.p_lst[-1]
+            body.remove(proto)
+            _BULK_PARAGRAPH_PROTOTYPES[key] = proto
+
+    new_ps = []
+    for text, key in specs:
+        p = deepcopy(_BULK_PARAGRAPH_PROTOTYPES[key])
+        runs = p.r_lst
+        if runs:
+            if text:
+                runs[0].text = text
+            else:
+                p.remove(runs[0])
+        new_ps.append(p)
+
+    sect_pr = body.sectPr
+    if sect_pr is not None:
+        idx = body.index(sect_pr)
+        body[idx:idx] = new_ps
+    else:
+        body.extend(new_ps)
 
 
 def _justify_document(doc: Document) -> None:
-    for p in doc.paragraphs:
-        p.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                for p in _iter_cell_paragraphs(cell):
-                    p.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+    # One tree walk covers body paragraphs and paragraphs in (nested) table cells.
+    for p in doc.element.body.iter(qn("w:p")):
+        p.get_or_add_pPr().jc_val = WD_ALIGN_PARAGRAPH.JUSTIFY
+
+
+def _has_devanagari(text: str) -> bool:
+    # U+0900..U+097F always encode to UTF-8 as E0 A4 xx or E0 A5 xx.
+    b = text.encode("utf-8", errors="ignore")
+    return b.find(b"\xe0\xa4") != -1 or b.find(b"\xe0\xa5") != -1
+
+
+_RE_DEVANAGARI_RUN = re.compile(r"[\u0900-\u097F]+")
+_RE_SPACE_RUN = re.compile(r"[ \t]{2,}")
 
 
+# Formal-table category labels and placeholder cells repeat across rows and requests.
+@functools.lru_cache(maxsize=512)
 def _strip_hindi(text: str) -> str:
-    t = re.sub(r"[\u0900-\u097F]+", "", text or "")
+    t = text or ""
+    if _has_devanagari(t):
+        t = _RE_DEVANAGARI_RUN.sub("", t)
     # Preserve original line layout; only normalize excessive spaces per line.
     lines = []
     for ln in t.splitlines():
-        ln = re.sub(r"[ \t]{2,}", " ", ln).rstrip()
+        ln = _RE_SPACE_RUN.sub(" ", ln).rstrip()
         lines.append(ln)
     return "\n".join(lines).strip()
 
@@ -172,15 +239,18 @@ def _blocktext(doc: Document, text: str) -> None:
     flush()
 
 
-def _extract_numbered_claims(amended_claims: str) -> List[Tuple[int, str]]:
+# Claim parsing is pure and re-run on the same amended-claims text by several
+# reply sections; results are cached as tuples so shared values stay immutable.
+@functools.lru_cache(maxsize=32)
+def _extract_numbered_claims(amended_claims: str) -> Tuple[Tuple[int, str], ...]:
     text = amended_claims or ""
     if not text.strip():
-        return []
+        return ()
 
     pat = re.compile(r"(?im)^\s*(\d+)[\.\):]\s*")
     matches = list(pat.finditer(text))
     if not matches:
-        return []
+        return ()
 
     claims: List[Tuple[int, str]] = []
     for i, m in enumerate(matches):
@@ -190,13 +260,14 @@ def _extract_numbered_claims(amended_claims: str) -> List[Tuple[int, str]]:
         block = text[start:end].strip()
         if block:
             claims.append((no, block))
-    return claims
+    return tuple(claims)
 
 
+@functools.lru_cache(maxsize=256)
 def _compact_claim_quote(text: str) -> str:
     t = _strip_hindi(text or "")
     t = t.replace("\r", " ").replace("\n", " ")
-    t = re.sub(r"\s+", " ", t).strip()
+    t = _norm_ws(t)
     t = re.sub(r"\s+([,.;:!?])", r"\1", t)
     t = re.sub(r"\(\s+", "(", t)
     t = re.sub(r"\s+\)", ")", t)
@@ -241,22 +312,11 @@ def _format_d_label_ranges(labels: List[str]) -> str:
         return ""
 
     nums = sorted(set(nums))
-    ranges = []
-    start = prev = nums[0]
-    for n in nums[1:]:
-        if n == prev + 1:
-            prev = n
-            continue
-        ranges.append((start, prev))
-        start = prev = n
-    ranges.append((start, prev))
-
     parts = []
-    for a, b in ranges:
-        if a == b:
-            parts.append(f"D{a}")
-        else:
-            parts.append(f"D{a}-D{b}")
+    # Consecutive numbers share the same (value - index) delta.
+    for _, grp in groupby(enumerate(nums), key=lambda ix: ix[1] - ix[0]):
+        g = [n for _, n in grp]
+        parts.append(f"D{g[0]}" if len(g) == 1 else f"D{g[0]}-D{g[-1]}")
     return ", ".join(parts)
 
 
@@ -270,8 +330,28 @@ def _resolve_dx_display(prior_labels: List[str], dx_range: str) -> str:
     return _normalize_dx_range(dx_range)
 
 
-def _normalize_prior_art_entries(prior_art_entries: Optional[List[Dict[str, str]]]) -> List[Dict[str, str]]:
-    normalized: List[Dict[str, str]] = []
+_RE_ANY_WS = re.compile(r"\s+")
+_RE_WS_NORMALIZE = re.compile(r"[ \t]{2,}|\n{3,}")
+
+
+def _norm_ws(s: str) -> str:
+    return _RE_ANY_WS.sub(" ", s).strip()
+
+
+def _ws_normalize_repl(m: re.Match) -> str:
+    return " " if m.group(0)[0] in " \t" else "\n\n"
+
+
+class _PriorArt(NamedTuple):
+    label: str
+    abstract: str
+    abstract_flat: str
+    diagram: str
+    diagram_path: str
+
+
+def _normalize_prior_art_entries(prior_art_entries: Optional[List[Dict[str, str]]]) -> List[_PriorArt]:
+    normalized: List[_PriorArt] = []
     for i, row in enumerate(prior_art_entries or [], 1):
         if not isinstance(row, dict):
             continue
@@ -280,32 +360,32 @@ def _normalize_prior_art_entries(prior_art_entries: Optional[List[Dict[str, str]
             label = f"D{i}"
 
         abstract = _strip_hindi(str(row.get("abstract", ""))).strip()
-        abstract = re.sub(r"[ \t]{2,}", " ", abstract)
-        abstract = re.sub(r"\n{3,}", "\n\n", abstract)
+        abstract = _RE_WS_NORMALIZE.sub(_ws_normalize_repl, abstract)
 
         diagram = _strip_hindi(str(row.get("diagram", ""))).strip()
-        diagram = re.sub(r"[ \t]{2,}", " ", diagram)
+        diagram = _RE_SPACE_RUN.sub(" ", diagram)
         diagram_path = str(row.get("diagram_path", "")).strip()
 
         if not abstract and not diagram and not diagram_path:
             continue
         normalized.append(
-            {
-                "label": label,
-                "abstract": abstract,
-                "diagram": diagram,
-                "diagram_path": diagram_path,
-            }
+            _PriorArt(
+                label=label,
+                abstract=abstract,
+                abstract_flat=_norm_ws(abstract),
+                diagram=diagram,
+                diagram_path=diagram_path,
+            )
         )
     return normalized
 
 
 def _truncate_words(text: str, max_words: int = 80) -> str:
-    raw = re.sub(r"\s+", " ", (text or "")).strip()
+    raw = _norm_ws(text or "")
     if not raw:
         return ""
 
-    words = re.findall(r"\S+", raw)
+    words = raw.split()
     if len(words) <= max_words:
         if raw[-1] in ".!?":
             return raw
@@ -333,7 +413,7 @@ def _truncate_words(text: str, max_words: int = 80) -> str:
 
 
 def _complete_sentence_text(text: str) -> str:
-    raw = re.sub(r"\s+", " ", (text or "")).strip()
+    raw = _norm_ws(text or "")
     if not raw:
         return ""
     if raw[-1] in ".!?":
@@ -341,11 +421,11 @@ def _complete_sentence_text(text: str) -> str:
     return f"{raw}."
 
 
-def _build_prior_art_disclosure_from_abstracts(prior_arts: List[Dict[str, str]]) -> str:
+def _build_prior_art_disclosure_from_abstracts(prior_arts: List[_PriorArt]) -> str:
     lines: List[str] = []
     for row in prior_arts:
-        label = row.get("label", "").strip()
-        abstract = re.sub(r"\s+", " ", row.get("abstract", "")).strip()
+        label = row.label
+        abstract = row.abstract_flat
         if not label or not abstract:
             continue
         lines.append(f"{label} discloses {_complete_sentence_text(abstract)}")
@@ -354,19 +434,19 @@ def _build_prior_art_disclosure_from_abstracts(prior_arts: List[Dict[str, str]])
 
 def _build_combined_difference_text(
     claim1_text: str,
-    prior_arts: List[Dict[str, str]],
+    prior_arts: List[_PriorArt],
     dx_display: str,
 ) -> str:
-    cleaned_claim = re.sub(r"\s+", " ", claim1_text or "").strip()
+    cleaned_claim = _norm_ws(claim1_text or "")
     if not prior_arts:
         return f"Combined difference over {dx_display}: [INSERT CLAIM-1 VS {dx_display} COMBINED DIFFERENCE ANALYSIS]."
 
     contrast_parts: List[str] = []
     for row in prior_arts:
-        label = (row.get("label", "") or "").strip()
+        label = row.label
         if not label:
             continue
-        abstract = re.sub(r"\s+", " ", row.get("abstract", "")).strip()
+        abstract = row.abstract_flat
         disclosed = _complete_sentence_text(abstract) if abstract else "[INSERT PRIOR-ART ABSTRACT DISCLOSURE]"
         contrast_parts.append(
             f"{label} discloses {disclosed}"
@@ -395,6 +475,31 @@ def _add_prior_art_diagram(doc: Document, diagram_path: str, label: str) -> None
         _placeholder(doc, f"[{label} DIAGRAM COULD NOT BE INSERTED]")
 
 
+_DX_FEATURES_PARA = (
+    "[Emphasis Added] {dx} discloses a completely different solution and does not set motivation to combine {dx} to "
+    "arrive at the Applicant claimed invention. Even the problem statement, and the solution of {dx} and Applicant "
+    "claimed invention is different and hence the solutions. The problem statement is clearly evident from background "
+    "of {dx} and Applicant claimed invention. It is to be noted that {dx} discloses completely different method and "
+    "does not disclose the following features of the applicant claimed invention:"
+)
+
+_DX_EXAMINER_PARA = (
+    "[Emphasis added] It is important to consider the functions and underlying essence of the invention as described "
+    "in all steps mentioned in the claims. Therefore, it is respectfully submitted that the interpretation asserted by "
+    "the Examiner is not supported by the disclosure of {dx}. Further, Applicant believe the interpretation asserted "
+    "by the Examiner regarding the claimed steps is not supported by the disclosure of {dx}. Nowhere in the cited "
+    "portions and the whole document does {dx} describe or reasonably suggest the above indicated features claimed in "
+    "the amended independent claim 1. Therefore, the steps of {dx} are different from that of Applicant’s claimed "
+    "subject matter. Additionally, a prima facie obviousness has not been established. Merely recitation of portions "
+    "from prior art does not sustain the rejection of obviousness unless the prior art reasonably teaches and provides "
+    "articulated reasoning with rational underpinning to support the legal conclusion of obviousness. Thus, based on "
+    "the above, to the extent {dx} does not disclose, reasonably teach or suggest the features of the amended "
+    "independent claim 1, and hence it is respectfully submitted that independent claim 1 is patentable over the "
+    "cited prior art. Nor does {dx} motivate one of ordinary skill in the art to combine {dx} with another reference "
+    "to arrive at the claimed invention. Reconsideration is respectfully requested."
+)
+
+
 def _add_regarding_claims_block(
     doc: Document,
     amended_claims: str,
@@ -408,7 +513,7 @@ def _add_regarding_claims_block(
         return
 
     normalized_prior_arts = _normalize_prior_art_entries(prior_art_entries)
-    prior_labels = [p["label"] for p in normalized_prior_arts if p.get("label")]
+    prior_labels = [p.label for p in normalized_prior_arts if p.label]
     dx_display = _resolve_dx_display(prior_labels, dx_range)
 
     dx_features = (dx_disclosed_features or "").strip()
@@ -417,8 +522,8 @@ def _add_regarding_claims_block(
     if not dx_features:
         dx_features = "[D1-Dn_DISCLOSURE]"
 
-    claim_text_map = {n: txt for n, txt in claims}
-    claim1_text = _compact_claim_quote(claim_text_map.get(1, "[INSERT AMENDED CLAIM 1 TEXT]"))
+    first = next((txt for n, txt in claims if n == 1), None)
+    claim1_text = _compact_claim_quote(first if first is not None else "[INSERT AMENDED CLAIM 1 TEXT]")
     claim1_line = claim1_text
 
     _para(doc, "Regarding Claim 1:", bold=True)
@@ -452,27 +557,21 @@ def _add_regarding_claims_block(
     _gap(doc, 2)
     if normalized_prior_arts:
         for row in normalized_prior_arts:
-            label = row["label"]
-            abstract = row.get("abstract", "")
-            if abstract:
-                abstract_text = re.sub(r"\s+", " ", abstract).strip()
-                if abstract_text:
-                    _para(doc, f"{label} discloses {abstract_text}")
-
-            diagram_path = row.get("diagram_path", "").strip()
+            label = row.label
+            if row.abstract_flat:
+                _para(doc, f"{label} discloses {row.abstract_flat}")
+
+            diagram_path = row.diagram_path
             if diagram_path:
                 _add_prior_art_diagram(doc, diagram_path, label)
 
-            diagram = row.get("diagram", "").strip()
+            diagram = row.diagram
             if diagram and not diagram_path:
                 _para(doc, diagram)
 
         _para_red(doc, _build_combined_difference_text(claim1_text, normalized_prior_arts, dx_display))
 
-        _para(
-            doc,
-            f"[Emphasis Added] {dx_display} discloses a completely different solution and does not set motivation to combine {dx_display} to arrive at the Applicant claimed invention. Even the problem statement, and the solution of {dx_display} and Applicant claimed invention is different and hence the solutions. The problem statement is clearly evident from background of {dx_display} and Applicant claimed invention. It is to be noted that {dx_display} discloses completely different method and does not disclose the following features of the applicant claimed invention:",
-        )
+        _para(doc, _DX_FEATURES_PARA.format(dx=dx_display))
     else:
         _placeholder(doc, f"[INSERT {dx_display} ABSTRACT(S) HERE]")
         _placeholder(doc, f"[EXPLAIN HOW INSTANT INVENTION DIFFERS FROM COMBINED {dx_display}]")
@@ -492,11 +591,9 @@ def _add_regarding_claims_block(
     f"A person with combining skills cannot combine the teachings provided in the prior arts ({dx_display}). "
     f"Hence, {dx_display} fails to disclose the features present in the invention. The interpretation asserted by the examiner is not supported by the cited portions of the {dx_display}. Thus, reconsideration is respectfully requested."
     )
-    _para(
-            doc,
-            f"[Emphasis added] It is important to consider the functions and underlying essence of the invention as described in all steps mentioned in the claims. Therefore, it is respectfully submitted that the interpretation asserted by the Examiner is not supported by the disclosure of {dx_display}. Further, Applicant believe the interpretation asserted by the Examiner regarding the claimed steps is not supported by the disclosure of {dx_display}. Nowhere in the cited portions and the whole document does {dx_display} describe or reasonably suggest the above indicated features claimed in the amended independent claim 1. Therefore, the steps of {dx_display} are different from that of Applicant’s claimed subject matter. Additionally, a prima facie obviousness has not been established. Merely recitation of portions from prior art does not sustain the rejection of obviousness unless the prior art reasonably teaches and provides articulated reasoning with rational underpinning to support the legal conclusion of obviousness. Thus, based on the above, to the extent {dx_display} does not disclose, reasonably teach or suggest the features of the amended independent claim 1, and hence it is respectfully submitted that independent claim 1 is patentable over the cited prior art. Nor does {dx_display} motivate one of ordinary skill in the art to combine {dx_display} with another reference to arrive at the claimed invention. Reconsideration is respectfully requested.",
-    )
+    _para(doc, _DX_EXAMINER_PARA.format(dx=dx_display))
 
+    dep_specs: List[Tuple[str, str]] = []
     for n, txt in claims:
         if n == 1:
             continue
@@ -508,20 +605,25 @@ def _add_regarding_claims_block(
                 dep_text_quoted = dep_text_quoted
             else:
                 dep_text_quoted = f'"{dep_text_quoted}"'
-        _gap(doc, 2)
-        _para(doc, f"Regarding Claim {n}:", bold=True)
-        _para(
-            doc,
-            f"Applicant has reviewed the entire application of {dx_display} and found that nowhere in the entire "
-            f"applications does {dx_display} describe or reasonably suggest the following features:",
-        )
-        _para(doc, dep_text_quoted)
-        _para(
-            doc,
-            f"Apart from the above, Applicant believes that dependent claim {n} is allowable not only by virtue of "
-            "dependency from patentable independent claim 1, but also by virtue of the additional features the claim "
-            "defines.",
+        dep_specs.extend(
+            [
+                ("", "gap2"),
+                (f"Regarding Claim {n}:", "bold"),
+                (
+                    f"Applicant has reviewed the entire application of {dx_display} and found that nowhere in the "
+                    f"entire applications does {dx_display} describe or reasonably suggest the following features:",
+                    "para",
+                ),
+                (dep_text_quoted, "para"),
+                (
+                    f"Apart from the above, Applicant believes that dependent claim {n} is allowable not only by "
+                    "virtue of dependency from patentable independent claim 1, but also by virtue of the additional "
+                    "features the claim defines.",
+                    "para",
+                ),
+            ]
         )
+    _emit_paragraphs_bulk(doc, dep_specs)
 
 
 _NON_PATENTABILITY_3K_PARA = (
@@ -620,7 +722,7 @@ _NON_PATENTABILITY_WRAPUP_PARA = (
 )
 
 
-def _claim_numbers_scope_label(claims: List[Tuple[int, str]]) -> str:
+def _claim_numbers_scope_label(claims: Sequence[Tuple[int, str]]) -> str:
     nums = sorted({n for n, _ in claims if n >= 1})
     if not nums:
         return "[INSERT CLAIM NUMBER(S)]"
@@ -629,14 +731,15 @@ def _claim_numbers_scope_label(claims: List[Tuple[int, str]]) -> str:
     return f"{nums[0]}-{nums[-1]}"
 
 
-def _extract_claim_text_for_technical_sections(amended_claims: str) -> Tuple[str, List[Tuple[int, str]]]:
+@functools.lru_cache(maxsize=32)
+def _extract_claim_text_for_technical_sections(amended_claims: str) -> Tuple[str, Tuple[Tuple[int, str], ...]]:
     claims = _extract_numbered_claims(amended_claims)
     if not claims:
         raw = _compact_claim_quote(amended_claims)
         raw = re.sub(r"^\s*\d+[\.\):]\s+", "", raw).strip()
         if raw:
-            return raw, [(1, raw)]
-        return "", []
+            return raw, ((1, raw),)
+        return "", ()
 
     by_num = {n: txt for n, txt in claims}
     claim1_raw = by_num.get(1, claims[0][1])
@@ -649,13 +752,13 @@ def _extract_claim_text_for_technical_sections(amended_claims: str) -> Tuple[str
         body = re.sub(r"^\s*\d+[\.\):]\s+", "", body).strip()
         if body:
             claim_entries.append((n, body))
-    return claim1, claim_entries
+    return claim1, tuple(claim_entries)
 
 
-def _claims_single_paragraph(claim_entries: List[Tuple[int, str]]) -> str:
+def _claims_single_paragraph(claim_entries: Sequence[Tuple[int, str]]) -> str:
     bodies: List[str] = []
     for _, claim_text in claim_entries:
-        body = re.sub(r"\s+", " ", (claim_text or "")).strip()
+        body = _norm_ws(claim_text or "")
         body = re.sub(r"^\s*\d+[\.\):]\s+", "", body).strip()
         if body:
             bodies.append(body)
@@ -726,6 +829,24 @@ def _add_non_patentability_static_paras(
     return added
 
 
+_TECH_CRI_SPECS = [
+    (_TECH_3K_REGULATION_PARA, "para"),
+    (_TECH_CRI_UPDATE_PARA, "para"),
+    (_TECH_CRI_QUOTE_1, "para"),
+    (_TECH_CRI_QUOTE_2, "para"),
+    (_TECH_PRESENTS_SOLUTION_PARA, "para"),
+]
+
+_TECH_EFFECT_CASE_LAW_SPECS = [
+    (_FERID_ALLANI_INTRO_PARA, "para"),
+    (_FERID_ALLANI_QUOTE_PARA, "para"),
+    (_TECH_EFFECT_BULLET_1, "para"),
+    (_TECH_EFFECT_BULLET_2, "para"),
+    (_TECH_EFFECT_GUIDELINE_PARA, "para"),
+    ("", "gap2"),
+]
+
+
 def _add_non_patentability_technical_sections(
     doc: Document,
     amended_claims: str,
@@ -782,11 +903,7 @@ def _add_non_patentability_technical_sections(
     else:
         _placeholder(doc, "[INSERT CLAIM-1 FEATURES HERE]")
     _para(doc, _TECH_HARDWARE_FEATURE_PARA, bold=True, underline=True)
-    _para(doc, _TECH_3K_REGULATION_PARA)
-    _para(doc, _TECH_CRI_UPDATE_PARA)
-    _para(doc, _TECH_CRI_QUOTE_1)
-    _para(doc, _TECH_CRI_QUOTE_2)
-    _para(doc, _TECH_PRESENTS_SOLUTION_PARA)
+    _emit_paragraphs_bulk(doc, _TECH_CRI_SPECS)
     if claim1_text:
         _para(doc, claim1_text)
     else:
@@ -796,12 +913,7 @@ def _add_non_patentability_technical_sections(
     else:
         _placeholder(doc, "[INSERT 'SUMMARY OF THE INVENTION' FROM CS HERE]")
 
-    _para(doc, _FERID_ALLANI_INTRO_PARA)
-    _para(doc, _FERID_ALLANI_QUOTE_PARA)
-    _para(doc, _TECH_EFFECT_BULLET_1)
-    _para(doc, _TECH_EFFECT_BULLET_2)
-    _para(doc, _TECH_EFFECT_GUIDELINE_PARA)
-    _gap(doc, 2)
+    _emit_paragraphs_bulk(doc, _TECH_EFFECT_CASE_LAW_SPECS)
     _obj_label(doc, "Technical Effect:")
     _para(doc, _TECH_EFFECT_DEFINITION_PARA)
     te_resolved = te or sm or bg
@@ -819,6 +931,8 @@ def _add_non_patentability_technical_sections(
     _para(doc, _NON_PATENTABILITY_WRAPUP_PARA)
 
 
+_FORMAL_ROW_PREFIX = r"^(?:In\s+the\s+)?(?:Whether\s+GPA,\s*SPA,)?\s*"
+
 _FORMAL_CATEGORY_PATTERNS = [
     ("Form 28", r"Form\s*28\b"),
     ("Form 18", r"Form\s*18\b"),
@@ -836,63 +950,146 @@ _FORMAL_CATEGORY_PATTERNS = [
     ("Other Deficiencies", r"Other\s+Deficiencies|fails\s+to\s+comply"),
 ]
 
+# Every label handed out by _category_from_formal_line is one of these shared objects.
+_CANONICAL_CATEGORIES = {cat: sys.intern(cat) for cat, _ in _FORMAL_CATEGORY_PATTERNS}
+
+# Strips the category heading (and any bare cue phrase) from a line classified under it.
+_STRIP_RE_BY_CAT: Dict[str, re.Pattern] = {
+    cat: re.compile(_FORMAL_ROW_PREFIX + pat + r"\s*", re.I) for cat, pat in _FORMAL_CATEGORY_PATTERNS
+}
+
+# Line-level "Form N" cues that win wherever they appear, in precedence order.
+_RE_FORM_NUMBER = re.compile(r"\bForm\s*(\d+)\b", re.I)
+_FORMAL_STRONG_FORMS = [(cat[len("Form "):], _CANONICAL_CATEGORIES[cat]) for cat, _ in _FORMAL_CATEGORY_PATTERNS[:7]]
+_RE_FORM2_CONTEXT = re.compile(r"specification|format|provisional|complete", re.I)
+_RE_FORM1_CONTEXT = re.compile(r"category|serial number|applicant", re.I)
+
+# Every remaining category pattern in one alternation: the start-anchored
+# headings first, then the bare cue phrases that may appear anywhere in a line.
+_RE_FORMAL_CATEGORY = re.compile(
+    _FORMAL_ROW_PREFIX
+    + r"(?:(?P<form2>Form\s*2\b)|(?P<form1>Form\s*1\b)|(?P<stamp>Stamp\s+[Dd]uty)"
+    r"|(?P<poa>Power\s+of\s+Attorney)|(?P<spec>Format\s+of\s+Specification)"
+    r"|(?P<draw>Format\s+of\s+Drawings)|(?P<other>Other\s+Deficiencies))"
+    r"|(?P<spec_cue>\(rule\s*13\))|(?P<draw_cue>In drawings|drawings sheet|section\s*78\(2\))"
+    r"|(?P<other_cue>fails\s+to\s+comply)",
+    re.I,
+)
+_FORMAL_GROUP_CATEGORIES = {
+    group: _CANONICAL_CATEGORIES[cat]
+    for group, cat in {
+        "form2": "Form 2",
+        "form1": "Form 1",
+        "stamp": "Stamp Duty",
+        "poa": "Power of Attorney",
+        "spec": "Format of Specification",
+        "spec_cue": "Format of Specification",
+        "draw": "Format of Drawings",
+        "draw_cue": "Format of Drawings",
+        "other": "Other Deficiencies",
+        "other_cue": "Other Deficiencies",
+    }.items()
+}
+_FORMAL_CATEGORY_RANK = {cat: i for i, (cat, _) in enumerate(_FORMAL_CATEGORY_PATTERNS)}
+
+# Every category pattern needs one of these words; most table lines are plain
+# remark continuations and contain none of them.
+_FORMAL_KEYWORDS = ("form", "stamp", "power", "rule", "drawings", "section", "other", "fails")
+
+# Common OCR fragments seen in FER formal tables, fixed in a single pass. The
+# lookbehind in "to_of" stands in for the word boundary the "attn" fix leaves
+# behind (its replacement always ends in a full stop).
+_RE_OCR_FRAGMENTS = re.compile(
+    r'(?P<words>(?-i:words ""))'
+    r"|(?P<attn>Applicant attention is drawn to of the Patents Act\.?)"
+    r"|(?P<to_of>(?:\b|(?<=Applicant attention is drawn to of the Patents Act))to of the Patents Act\.?)"
+    r"|(?P<part_iv>\s*-\s*IV\s*:?\s*/?\s*$)",
+    re.I,
+)
+_OCR_FRAGMENT_FIXES = {
+    "words": 'words "We Claim"',
+    "attn": "Applicant attention is drawn to section 78(2) of the Patents Act.",
+    "to_of": "to section 78(2) of the Patents Act.",
+    "part_iv": "",
+}
+
+
+def _ocr_fragment_fix(m: re.Match) -> str:
+    return _OCR_FRAGMENT_FIXES[m.lastgroup]
+
+
+_RE_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+# Every ASCII byte except a-z and 0-9; sentence keys drop them (and all non-ASCII).
+_SENTENCE_KEY_DELETE = bytes(b for b in range(128) if not (97 <= b <= 122 or 48 <= b <= 57))
+
+_FORMAL_SPLIT_CUES = [
+    ("Form 1", re.compile(r"\bWhile filing the instant application,\s*in Form\s*1\b", re.I)),
+    ("Form 2", re.compile(r"\bIn Form\s*2\b", re.I)),
+    ("Form 28", re.compile(r"\bApplicant is required to submit Form 28\b", re.I)),
+]
+
+_RE_FORMAL_HDR = re.compile(r"(?:Objections?)[^\n]*?Remarks?", re.I)
+_RE_PAGE_BANNER = re.compile(r"\n?Page\s+\d+\s+of\s+\d+\s*\n?THE\s+PATENT\s+OFFICE\s*\n?", re.I)
+_RE_PART_IV = re.compile(r"\bPART\s*[-–]\s*IV\b.*$", re.I | re.S)
+# Lines that end the formal table. Cleaned lines carry single spaces only, so
+# "PART\s*[-–]\s*IV" reduces to a handful of literal prefixes.
+_FORMAL_TABLE_END_PREFIXES = ("DOCUMENTS ON RECORD",) + tuple(
+    f"PART{sp1}{dash}{sp2}IV" for sp1 in ("", " ") for dash in "-–" for sp2 in ("", " ")
+)
+
 
 def _category_from_formal_line(line: str) -> Optional[str]:
     s = line.strip(" /:-")
     if not s:
         return None
+    # Non-ASCII lines go straight to the regexes, whose case folding is wider than str.lower().
+    if s.isascii():
+        low = s.lower()
+        if not any(kw in low for kw in _FORMAL_KEYWORDS):
+            return None
 
     # Strong line-level cues first.
-    if re.search(r"\bForm\s*28\b", s, re.I):
-        return "Form 28"
-    if re.search(r"\bForm\s*18\b", s, re.I):
-        return "Form 18"
-    if re.search(r"\bForm\s*13\b", s, re.I):
-        return "Form 13"
-    if re.search(r"\bForm\s*9\b", s, re.I):
-        return "Form 9"
-    if re.search(r"\bForm\s*8\b", s, re.I):
-        return "Form 8"
-    if re.search(r"\bForm\s*5\b", s, re.I):
-        return "Form 5"
-    if re.search(r"\bForm\s*3\b", s, re.I):
-        return "Form 3"
-    if re.search(r"\bForm\s*2\b", s, re.I) and re.search(r"specification|format|provisional|complete", s, re.I):
-        return "Form 2"
-    if re.search(r"\bForm\s*1\b", s, re.I) and re.search(r"category|serial number|applicant", s, re.I):
-        return "Form 1"
-
-    for cat, pat in _FORMAL_CATEGORY_PATTERNS:
-        if re.search(r"^(?:In\s+the\s+)?(?:Whether\s+GPA,\s*SPA,)?\s*" + pat, s, re.I):
-            return cat
-    return None
+    numbers = _RE_FORM_NUMBER.findall(s)
+    if numbers:
+        for num, cat in _FORMAL_STRONG_FORMS:
+            if num in numbers:
+                return cat
+        if "2" in numbers and _RE_FORM2_CONTEXT.search(s):
+            return _CANONICAL_CATEGORIES["Form 2"]
+        if "1" in numbers and _RE_FORM1_CONTEXT.search(s):
+            return _CANONICAL_CATEGORIES["Form 1"]
+
+    # A single scan; the earliest category in _FORMAL_CATEGORY_PATTERNS wins.
+    best: Optional[str] = None
+    for m in _RE_FORMAL_CATEGORY.finditer(s):
+        cat = _FORMAL_GROUP_CATEGORIES[m.lastgroup]
+        if best is None or _FORMAL_CATEGORY_RANK[cat] < _FORMAL_CATEGORY_RANK[best]:
+            best = cat
+    return best
 
 
 def _clean_formal_line(line: str) -> str:
     s = (line or "").strip()
-    s = re.sub(r"^[/|]+", "", s).strip()
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    s = s.lstrip("/|").strip()
+    return _norm_ws(s)
 
 
 def _clean_formal_remark(remark: str) -> str:
-    t = re.sub(r"\s+", " ", (remark or "")).strip()
+    t = _norm_ws(remark or "")
     if not t:
         return ""
 
-    # Common OCR fragments seen in FER formal tables.
-    t = t.replace('words ""', 'words "We Claim"')
-    t = re.sub(r"Applicant attention is drawn to of the Patents Act\.?", "Applicant attention is drawn to section 78(2) of the Patents Act.", t, flags=re.I)
-    t = re.sub(r"\bto of the Patents Act\.?", "to section 78(2) of the Patents Act.", t, flags=re.I)
-    t = re.sub(r"\s+", " ", t).strip()
-    t = re.sub(r"\s*-\s*IV\s*:?\s*/?\s*$", "", t, flags=re.I).strip()
+    t = _RE_OCR_FRAGMENTS.sub(_ocr_fragment_fix, t).strip()
 
-    # Deduplicate repeated sentences while preserving order.
-    parts = [p.strip() for p in re.split(r"(?<=[.!?])\s+", t) if p.strip()]
+    # Deduplicate repeated sentences while preserving order. Without a sentence
+    # terminator the remark is a single sentence and comes back unchanged.
+    if "." not in t and "!" not in t and "?" not in t:
+        return t
+    parts = [p.strip() for p in _RE_SENTENCE_SPLIT.split(t) if p.strip()]
     dedup = []
     seen = set()
     for p in parts:
-        key = re.sub(r"[^a-z0-9]+", "", p.lower())
+        key = p.lower().encode("ascii", "ignore").translate(None, _SENTENCE_KEY_DELETE)
         if key and key not in seen:
             seen.add(key)
             dedup.append(p)
@@ -902,18 +1099,12 @@ def _clean_formal_remark(remark: str) -> str:
 
 
 def _split_mixed_formal_rows(rows: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
-    split_cues = [
-        ("Form 1", r"\bWhile filing the instant application,\s*in Form\s*1\b"),
-        ("Form 2", r"\bIn Form\s*2\b"),
-        ("Form 28", r"\bApplicant is required to submit Form 28\b"),
-    ]
-
     out: List[Tuple[str, str]] = []
     for cat, remark in rows:
         r = remark or ""
         split_done = False
-        for target_cat, cue in split_cues:
-            m = re.search(cue, r, re.I)
+        for target_cat, cue_re in _FORMAL_SPLIT_CUES:
+            m = cue_re.search(r)
             if not m or target_cat == cat:
                 continue
             head = _clean_formal_remark(r[:m.start()].strip())
@@ -933,10 +1124,10 @@ def _parse_formal_rows(text: str):
     if not text:
         return []
 
-    m_hdr = re.search(r"(?:Objections?)[^\n]*?Remarks?", text, re.I)
+    m_hdr = _RE_FORMAL_HDR.search(text)
     table_text = text[m_hdr.end():].strip() if m_hdr else text
-    table_text = re.sub(r"\n?Page\s+\d+\s+of\s+\d+\s*\n?THE\s+PATENT\s+OFFICE\s*\n?", "\n", table_text, flags=re.I)
-    table_text = re.sub(r"\bPART\s*[-–]\s*IV\b.*$", "", table_text, flags=re.I | re.S).strip()
+    table_text = _RE_PAGE_BANNER.sub("\n", table_text)
+    table_text = _RE_PART_IV.sub("", table_text).strip()
 
     lines = [_clean_formal_line(ln) for ln in table_text.splitlines()]
     lines = [ln for ln in lines if ln and len(ln) > 2]
@@ -950,34 +1141,22 @@ def _parse_formal_rows(text: str):
         if not current_cat:
             current_parts = []
             return
+        # Lines are already whitespace-normalized; _clean_formal_remark covers the rest.
         remark = " ".join(current_parts).strip()
-        remark = re.sub(r"\s+", " ", remark).strip()
         if remark:
             rows.append((current_cat, _clean_formal_remark(remark)[:1200]))
         current_cat = None
         current_parts = []
 
     for ln in lines:
-        if re.search(r"^DOCUMENTS\s+ON\s+RECORD", ln, re.I):
-            break
-        if re.search(r"^PART\s*[-–]\s*IV", ln, re.I):
+        if ln[:20].upper().startswith(_FORMAL_TABLE_END_PREFIXES):
             break
 
         cat = _category_from_formal_line(ln)
         if cat:
             flush()
             current_cat = cat
-            stripped = ln
-            for c2, pat in _FORMAL_CATEGORY_PATTERNS:
-                if c2 == cat:
-                    stripped = re.sub(
-                        r"^(?:In\s+the\s+)?(?:Whether\s+GPA,\s*SPA,)?\s*" + pat + r"\s*",
-                        "",
-                        stripped,
-                        flags=re.I,
-                    )
-                    break
-            stripped = stripped.strip(" :-")
+            stripped = _STRIP_RE_BY_CAT[cat].sub("", ln).strip(" :-")
             if stripped:
                 current_parts.append(stripped)
             continue
@@ -989,21 +1168,15 @@ def _parse_formal_rows(text: str):
 
     rows = _split_mixed_formal_rows(rows)
 
-    # Merge duplicate categories while preserving discovery order.
-    merged = {}
-    order: List[str] = []
+    # Merge duplicate categories while preserving discovery order (dicts keep insertion order).
+    # Remarks come back normalized from _clean_formal_remark, so empty ones are simply skipped.
+    merged: Dict[str, List[str]] = {}
     for cat, remark in rows:
-        if cat not in merged:
-            merged[cat] = []
-            order.append(cat)
-        merged[cat].append(remark)
-
-    final_rows = []
-    for cat in order:
-        joined = " ".join(merged[cat])
-        joined = re.sub(r"\s+", " ", joined).strip()
-        if joined:
-            final_rows.append((cat, joined[:900]))
+        parts = merged.setdefault(cat, [])
+        if remark:
+            parts.append(remark)
+
+    final_rows = [(cat, " ".join(parts)[:900]) for cat, parts in merged.items() if parts]
 
     if not final_rows and table_text:
         return [("Formal Requirements", table_text[:1200])]
@@ -1015,32 +1188,171 @@ def _add_formal_table(
     fer_formal_text: str = "",
     fer_formal_rows: Optional[List[Tuple[str, str]]] = None,
 ) -> None:
-    table = doc.add_table(rows=1, cols=3)
-    table.style = "Table Grid"
-
-    for cell, label in zip(table.rows[0].cells, ["Objections", "Remarks", "Our Reply"]):
-        cell.text = label
-        if cell.paragraphs and cell.paragraphs[0].runs:
-            cell.paragraphs[0].runs[0].bold = True
-
     if fer_formal_rows:
-        for ob, rem in fer_formal_rows:
-            row = table.add_row().cells
-            row[0].text = _strip_hindi(ob)
-            row[1].text = _strip_hindi(rem)
-            _set_cell_placeholder_red(row[2], "[INSERT COMPLIANCE STATEMENT / REPLY HERE]")
+        body_rows = [
+            (_strip_hindi(ob), _strip_hindi(rem), "[INSERT COMPLIANCE STATEMENT / REPLY HERE]")
+            for ob, rem in fer_formal_rows
+        ]
     else:
         raw_formal = (fer_formal_text or "").strip()
         if raw_formal:
-            row = table.add_row().cells
-            row[0].text = "As in FER"
-            row[1].text = _strip_hindi(raw_formal)
-            _set_cell_placeholder_red(row[2], "[INSERT COMPLIANCE STATEMENT / REPLY HERE]")
+            body_rows = [("As in FER", _strip_hindi(raw_formal), "[INSERT COMPLIANCE STATEMENT / REPLY HERE]")]
         else:
-            row = table.add_row().cells
-            row[0].text = "[FORMAL OBJECTION CATEGORY]"
-            row[1].text = "[PASTE REMARKS FROM FER HERE]"
-            _set_cell_placeholder_red(row[2], "[INSERT COMPLIANCE STATEMENT HERE]")
+            body_rows = [
+                ("[FORMAL OBJECTION CATEGORY]", "[PASTE REMARKS FROM FER HERE]", "[INSERT COMPLIANCE STATEMENT HERE]")
+            ]
+
+    # Allocate every row up front and write runs straight into each cell's
+    # empty paragraph rather than going through the cell.text setter.
+    table = doc.add_table(rows=1 + len(body_rows), cols=3)
+    table.style = "Table Grid"
+    trs = table._tbl.tr_lst
+
+    for tc, label in zip(trs[0].tc_lst, ["Objections", "Remarks", "Our Reply"]):
+        r = tc.p_lst[0].add_r()
+        r.text = label
+        Run(r, table).bold = True
+
+    for tr, (ob, rem, reply_placeholder) in zip(trs[1:], body_rows):
+        tc_ob, tc_rem, tc_reply = tr.tc_lst
+        tc_ob.p_lst[0].add_r().text = ob
+        tc_rem.p_lst[0].add_r().text = rem
+        _set_cell_placeholder_red(_Cell(tc_reply, table), reply_placeholder)
+
+
+@dataclass
+class _ReplyContext:
+    amended_claims: str
+    claims_blocks: Tuple[Tuple[int, str], ...]
+    claim_scope_label: str
+    dx_range: str
+    dx_disclosed_features: str
+    prior_art_entries: Optional[List[Dict[str, str]]]
+    cs_background_text: str
+    cs_summary_text: str
+    cs_technical_effect_text: str
+    technical_effect_image_paths: Optional[List[str]]
+    regarding_claims_content_rendered: bool = False
+    non_pat_technical_sections_rendered: bool = False
+
+
+def _render_regarding_claims(doc: Document, ctx: _ReplyContext) -> None:
+    _add_regarding_claims_block(
+        doc,
+        ctx.amended_claims,
+        dx_range=ctx.dx_range,
+        dx_disclosed_features=ctx.dx_disclosed_features,
+        prior_art_entries=ctx.prior_art_entries,
+    )
+    ctx.regarding_claims_content_rendered = True
+
+
+def _render_non_pat_technical_sections(doc: Document, ctx: _ReplyContext, include_static_3k_text: bool) -> None:
+    _add_non_patentability_technical_sections(
+        doc,
+        amended_claims=ctx.amended_claims,
+        cs_background_text=ctx.cs_background_text,
+        cs_summary_text=ctx.cs_summary_text,
+        cs_technical_effect_text=ctx.cs_technical_effect_text,
+        technical_effect_image_paths=ctx.technical_effect_image_paths,
+        include_static_3k_text=include_static_3k_text,
+    )
+    ctx.non_pat_technical_sections_rendered = True
+
+
+def _reply_inventive_step(doc: Document, obj: Objection, ctx: _ReplyContext) -> None:
+    if ctx.claims_blocks:
+        _render_regarding_claims(doc, ctx)
+    else:
+        _placeholder(doc, "[EXPLAIN HOW AMENDED CLAIM OVERCOMES D1, D2, etc.]")
+        _placeholder(doc, "[ADD INSTANT INVENTION vs PRIOR ART TABLE IF NEEDED]")
+
+
+def _reply_non_patentability(doc: Document, obj: Objection, ctx: _ReplyContext) -> None:
+    non_pat_text = f"{obj.heading}\n{obj.body}"
+    has_3k_clause = _contains_section_clause(non_pat_text, "k")
+    if not _add_non_patentability_static_paras(doc, non_pat_text, ctx.claim_scope_label):
+        _placeholder(doc, "[INSERT SECTION 3(f)/3(o)/3(k) ARGUMENT HERE]")
+    _placeholder(doc, "[EXPLAIN WHY INVENTION IS NOT EXCLUDED UNDER CITED CLAUSE]")
+    if not ctx.non_pat_technical_sections_rendered:
+        _render_non_pat_technical_sections(doc, ctx, include_static_3k_text=has_3k_clause)
+
+
+def _reply_regarding_claims(doc: Document, obj: Objection, ctx: _ReplyContext) -> None:
+    if ctx.regarding_claims_content_rendered:
+        _para(
+            doc,
+            "Detailed claim-wise distinction over cited prior art is already submitted above under the Inventive Step reply.",
+        )
+    else:
+        _render_regarding_claims(doc, ctx)
+
+
+def _placeholder_reply(*texts: str):
+    def reply(doc: Document, obj: Objection, ctx: _ReplyContext) -> None:
+        for text in texts:
+            _placeholder(doc, text)
+
+    return reply
+
+
+# Heading keyword -> reply handler; the first keyword found in the heading wins.
+_OBJECTION_HANDLER_KEYWORDS = (
+    ("INVENTIVE STEP", "inventive"),
+    ("NOVELTY", "novelty"),
+    ("NON PATENTABILITY", "non_pat"),
+    ("REGARDING CLAIMS", "regarding"),
+    ("SUFFICIENCY", "sufficiency"),
+    ("CLARITY", "clarity"),
+    ("DEFINITIVENESS", "definitiveness"),
+    ("SCOPE", "scope"),
+    ("OTHERS", "others"),
+)
+
+_OBJECTION_HANDLERS = {
+    "inventive": _reply_inventive_step,
+    "novelty": _placeholder_reply(
+        "[INSERT NOVELTY ARGUMENT AGAINST CITED PRIOR ART HERE]",
+        "[EXPLAIN DISTINGUISHING FEATURES OF AMENDED CLAIMS HERE]",
+    ),
+    "non_pat": _reply_non_patentability,
+    "regarding": _reply_regarding_claims,
+    "sufficiency": _placeholder_reply("[INSERT ABSTRACT / SUFFICIENCY COMPLIANCE STATEMENT HERE]"),
+    "clarity": _placeholder_reply("[INSERT CLARITY RESPONSE - EXPLAIN HOW AMENDMENTS ADDRESS EACH POINT]"),
+    "definitiveness": _placeholder_reply("[INSERT DEFINITIVENESS RESPONSE (Sec 10(4)(c), 10(5)) HERE]"),
+    "scope": _placeholder_reply("[INSERT SCOPE RESPONSE - EXPLAIN HOW CLAIMS DEFINE CLEAR BOUNDARIES]"),
+    "others": _placeholder_reply("[INSERT RESPONSE TO OTHER REQUIREMENTS HERE]"),
+}
+
+
+# Skeleton for six objections, used when the FER yielded none.
+_EMPTY_OBJECTIONS_SPECS = [
+    spec
+    for i in range(1, 7)
+    for spec in (
+        (f"SUBMISSION TO OBJECTION {i}", "heading"),
+        (f"[PASTE EXAMINER'S OBJECTION {i} TEXT HERE]", "placeholder"),
+        ("OUR REPLY:", "reply_label"),
+        (f"[INSERT REPLY TO OBJECTION {i} HERE]", "placeholder"),
+    )
+]
+
+_CLOSING_SPECS = [
+    ("", "gap10"),
+    (
+        "In the event above submissions are not found to be persuasive, a further hearing/an opportunity for "
+        "clarification (through telephone, meeting or the like), preferably in view of Section 80 or Section 14 "
+        "may please be granted before taking any adverse decision.",
+        "para",
+    ),
+    ("", "gap8"),
+    ("Yours faithfully,", "para"),
+    ("Adv. Pranav Bhat ", "para"),
+    ("(Patent Agent - IN/PA 4580)", "para"),
+    ("", "gap6"),
+    ("Enclosure:", "para"),
+    ("1. [List enclosures here]", "placeholder"),
+]
 
 
 def generate_reply_docx(
@@ -1065,37 +1377,33 @@ def generate_reply_docx(
     doc.styles["Normal"].font.size = Pt(11)
 
     today = datetime.date.today().strftime("%d %B %Y")
-    _para(doc, today)
-    _para(doc, "To,")
-
     address_lines = [ln.strip() for ln in (office_address or "").splitlines() if ln.strip()]
     if not address_lines:
         address_lines = ["THE PATENT OFFICE", "I.P.O BUILDING", "G.S.T.Road, Guindy", "Chennai - [PIN]"]
-    for ln in address_lines:
-        _para(doc, ln)
-    _gap(doc, 8)
-
     controller = fer.controller_name or "[Controller Name]"
-    _para(doc, f"Kind Attention: {controller}, Controller of Patents")
-    _gap(doc, 4)
-
     app_no = fer.application_no or "[Application No]"
     filing = fer.filing_date or "[Filing Date]"
     fer_date = fer.fer_dispatch_date or "[FER Date]"
     appl = fer.applicant or "[Applicant]"
     title = cs_title or fer.title or "[Title of Invention]"
 
-    _para(doc, f"Re: Response to FER dated {fer_date}, with respect to Patent Application No: {app_no} filed on {filing}")
-    _para(doc, f"Applicant(s): {appl}")
-    _para(doc, f'Title: "{title}"')
-    _para(doc, f"Letter No: Ref.No/Application No /{app_no} Dated: {fer_date}")
-    _gap(doc, 6)
-    _para(doc, "Dear Sir,")
-    _para(
-        doc,
+    header_items = [
+        today,
+        "To,",
+        *address_lines,
+        _GAP8,
+        f"Kind Attention: {controller}, Controller of Patents",
+        _GAP4,
+        f"Re: Response to FER dated {fer_date}, with respect to Patent Application No: {app_no} filed on {filing}",
+        f"Applicant(s): {appl}",
+        f'Title: "{title}"',
+        f"Letter No: Ref.No/Application No /{app_no} Dated: {fer_date}",
+        _GAP6,
+        "Dear Sir,",
         f"With reference to your letter No Ref/Application No /{app_no} dated {fer_date}, "
         "our humble submissions in the FER matter are as follows for and on behalf of applicant herein:",
-    )
+    ]
+    _emit_paragraphs_bulk(doc, [item if isinstance(item, tuple) else (item, "para") for item in header_items])
 
     _heading(doc, "AMENDMENTS MADE TO THE CLAIMS ARE AS FOLLOWS")
     _para(doc, "We Claim:", bold=True)
@@ -1113,145 +1421,66 @@ def generate_reply_docx(
     _gap(doc, 8)
 
     objections = fer.objections or []
-    has_regarding_claims_objection = False
-    regarding_claims_content_rendered = False
-    non_pat_technical_sections_rendered = False
+    ctx = _ReplyContext(
+        amended_claims=amended_claims,
+        claims_blocks=claims_blocks,
+        claim_scope_label=claim_scope_label,
+        dx_range=dx_range,
+        dx_disclosed_features=dx_disclosed_features,
+        prior_art_entries=prior_art_entries,
+        cs_background_text=cs_background_text,
+        cs_summary_text=cs_summary_text,
+        cs_technical_effect_text=cs_technical_effect_text,
+        technical_effect_image_paths=technical_effect_image_paths,
+    )
+
+    # Classify every heading once; whether a trailing REGARDING CLAIMS block is
+    # needed is then known before any objection is rendered.
+    upper_headings = [obj.heading.upper() for obj in objections]
+    handler_keys = [next((k for kw, k in _OBJECTION_HANDLER_KEYWORDS if kw in h), None) for h in upper_headings]
+    needs_regarding_claims_block = bool(claims_blocks) and not {"inventive", "regarding"}.intersection(handler_keys)
 
     if not objections:
-        for i in range(1, 7):
-            _heading(doc, f"SUBMISSION TO OBJECTION {i}")
-            _placeholder(doc, f"[PASTE EXAMINER'S OBJECTION {i} TEXT HERE]")
-            _reply_label(doc)
-            _placeholder(doc, f"[INSERT REPLY TO OBJECTION {i} HERE]")
+        _emit_paragraphs_bulk(doc, _EMPTY_OBJECTIONS_SPECS)
     else:
-        for obj in objections:
-            h = obj.heading.upper()
+        for obj, h, key in zip(objections, upper_headings, handler_keys):
             if "REGARDING CLAIMS" in h:
                 _obj_label(doc, "REGARDING CLAIMS:")
             else:
                 _heading(doc, f"SUBMISSION TO OBJECTION {obj.number}")
-                _obj_label(doc, obj.heading.upper() + ":")
+                _obj_label(doc, h + ":")
             _blocktext(doc, obj.body)
             _gap(doc, 4)
             _reply_label(doc)
 
-            if "INVENTIVE STEP" in h:
-                if _extract_numbered_claims(amended_claims):
-                    _add_regarding_claims_block(
-                        doc,
-                        amended_claims,
-                        dx_range=dx_range,
-                        dx_disclosed_features=dx_disclosed_features,
-                        prior_art_entries=prior_art_entries,
-                    )
-                    regarding_claims_content_rendered = True
-                    has_regarding_claims_objection = True
-                else:
-                    _placeholder(doc, "[EXPLAIN HOW AMENDED CLAIM OVERCOMES D1, D2, etc.]")
-                    _placeholder(doc, "[ADD INSTANT INVENTION vs PRIOR ART TABLE IF NEEDED]")
-            elif "NOVELTY" in h:
-                _placeholder(doc, "[INSERT NOVELTY ARGUMENT AGAINST CITED PRIOR ART HERE]")
-                _placeholder(doc, "[EXPLAIN DISTINGUISHING FEATURES OF AMENDED CLAIMS HERE]")
-            elif "NON PATENTABILITY" in h:
-                non_pat_text = f"{obj.heading}\n{obj.body}"
-                has_3k_clause = _contains_section_clause(non_pat_text, "k")
-                if not _add_non_patentability_static_paras(doc, non_pat_text, claim_scope_label):
-                    _placeholder(doc, "[INSERT SECTION 3(f)/3(o)/3(k) ARGUMENT HERE]")
-                _placeholder(doc, "[EXPLAIN WHY INVENTION IS NOT EXCLUDED UNDER CITED CLAUSE]")
-                if not non_pat_technical_sections_rendered:
-                    _add_non_patentability_technical_sections(
-                        doc,
-                        amended_claims=amended_claims,
-                        cs_background_text=cs_background_text,
-                        cs_summary_text=cs_summary_text,
-                        cs_technical_effect_text=cs_technical_effect_text,
-                        technical_effect_image_paths=technical_effect_image_paths,
-                        include_static_3k_text=has_3k_clause,
-                    )
-                    non_pat_technical_sections_rendered = True
-            elif "REGARDING CLAIMS" in h:
-                has_regarding_claims_objection = True
-                if regarding_claims_content_rendered:
-                    _para(
-                        doc,
-                        "Detailed claim-wise distinction over cited prior art is already submitted above under the Inventive Step reply.",
-                    )
-                else:
-                    _add_regarding_claims_block(
-                        doc,
-                        amended_claims,
-                        dx_range=dx_range,
-                        dx_disclosed_features=dx_disclosed_features,
-                        prior_art_entries=prior_art_entries,
-                    )
-                    regarding_claims_content_rendered = True
-            elif "SUFFICIENCY" in h:
-                _placeholder(doc, "[INSERT ABSTRACT / SUFFICIENCY COMPLIANCE STATEMENT HERE]")
-            elif "CLARITY" in h:
-                _placeholder(doc, "[INSERT CLARITY RESPONSE - EXPLAIN HOW AMENDMENTS ADDRESS EACH POINT]")
-            elif "DEFINITIVENESS" in h:
-                _placeholder(doc, "[INSERT DEFINITIVENESS RESPONSE (Sec 10(4)(c), 10(5)) HERE]")
-            elif "SCOPE" in h:
-                _placeholder(doc, "[INSERT SCOPE RESPONSE - EXPLAIN HOW CLAIMS DEFINE CLEAR BOUNDARIES]")
-            elif "OTHERS" in h:
-                _placeholder(doc, "[INSERT RESPONSE TO OTHER REQUIREMENTS HERE]")
+            if key:
+                _OBJECTION_HANDLERS[key](doc, obj, ctx)
             else:
                 _placeholder(doc, f"[INSERT REPLY TO OBJECTION {obj.number} HERE]")
             _gap(doc, 8)
 
-    if (
-        not has_regarding_claims_objection
-        and not regarding_claims_content_rendered
-        and _extract_numbered_claims(amended_claims)
-    ):
+    if needs_regarding_claims_block:
         _obj_label(doc, "REGARDING CLAIMS:")
         _reply_label(doc)
-        _add_regarding_claims_block(
-            doc,
-            amended_claims,
-            dx_range=dx_range,
-            dx_disclosed_features=dx_disclosed_features,
-            prior_art_entries=prior_art_entries,
-        )
-        regarding_claims_content_rendered = True
+        _render_regarding_claims(doc, ctx)
         _gap(doc, 8)
 
-    if not non_pat_technical_sections_rendered:
+    if not ctx.non_pat_technical_sections_rendered:
         _heading(doc, "SUBMISSION TO NON PATENTABILITY U/S 3")
         _obj_label(doc, "NON PATENTABILITY U/S 3:")
         _reply_label(doc)
         _placeholder(doc, "[INSERT SECTION 3(k)/3(m) ARGUMENT HERE]")
         _placeholder(doc, "[EXPLAIN WHY INVENTION IS NOT EXCLUDED UNDER CITED CLAUSE]")
-        _add_non_patentability_technical_sections(
-            doc,
-            amended_claims=amended_claims,
-            cs_background_text=cs_background_text,
-            cs_summary_text=cs_summary_text,
-            cs_technical_effect_text=cs_technical_effect_text,
-            technical_effect_image_paths=technical_effect_image_paths,
-            include_static_3k_text=False,
-        )
+        _render_non_pat_technical_sections(doc, ctx, include_static_3k_text=False)
         _gap(doc, 8)
 
     _heading(doc, "FORMAL REQUIREMENTS:")
     _add_formal_table(doc, formal_reqs_text, formal_reqs_rows)
 
-    _gap(doc, 10)
-    _para(
-        doc,
-        "In the event above submissions are not found to be persuasive, a further hearing/an opportunity for "
-        "clarification (through telephone, meeting or the like), preferably in view of Section 80 or Section 14 "
-        "may please be granted before taking any adverse decision.",
-    )
-    _gap(doc, 8)
-    _para(doc, "Yours faithfully,")
-    _para(doc, "Adv. Pranav Bhat ")
-    _para(doc, "(Patent Agent - IN/PA 4580)")
-    _gap(doc, 6)
-    _para(doc, "Enclosure:")
-    _placeholder(doc, "1. [List enclosures here]")
+    _emit_paragraphs_bulk(doc, _CLOSING_SPECS)
 
     _justify_document(doc)
-    if doc.paragraphs:
-        doc.paragraphs[0].paragraph_format.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+    first_p = doc.element.body.find(qn("w:p"))
+    if first_p is not None:
+        first_p.get_or_add_pPr().jc_val = WD_ALIGN_PARAGRAPH.RIGHT
     return doc
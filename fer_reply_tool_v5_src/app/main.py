@@ -1,19 +1,28 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import io
 import json
+import multiprocessing
 import os
+import shutil
 import tempfile
-from typing import Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import IO, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException
 from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.core.fer_parser import (
+    FerParseResult, PdfSource, DocxSource,
     parse_fer_pdf, to_dict, read_pdf_text,
-    extract_detailed_observations_block,
-    extract_formal_requirements_block,
+    extract_fer_sections,
     extract_formal_requirements_rows_from_pdf,
     extract_title_from_cs_pdf,
     extract_title_from_cs_docx,
@@ -28,15 +37,26 @@ from app.core.reply_generator import generate_reply_docx
 from app.core.claims_parser import extract_amended_claims_from_pdf, extract_amended_claims_from_docx
 from app.core.prior_art_parser import (
     clean_prior_art_text,
-    extract_prior_art_abstract_from_pdf,
     extract_prior_art_abstract_from_docx,
-    is_scanned_prior_art_pdf,
     normalize_prior_art_label,
+    scan_and_extract_prior_art_pdf,
 )
 
-app = FastAPI(title="FER Reply Generator")
+@asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    yield
+    # Stop the prior-art workers with the app so reloads don't orphan them.
+    if _PRIOR_ART_POOL is not None:
+        _discard_prior_art_pool(_PRIOR_ART_POOL)
+
+
+app = FastAPI(title="FER Reply Generator", lifespan=_lifespan)
 app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_credentials=True,
                    allow_methods=["*"], allow_headers=["*"])
+# JSON previews compress well; the DOCX reply is already a ZIP and opts out via Content-Encoding.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+_DOCX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
 
 
 def _safe_json_list(raw: str) -> List[Dict]:
@@ -51,22 +71,18 @@ def _safe_json_list(raw: str) -> List[Dict]:
     return [x for x in data if isinstance(x, dict)]
 
 
-def _safe_file_suffix(name: str, fallback: str = ".bin") -> str:
-    base = (name or "").strip()
-    _, ext = os.path.splitext(base)
-    ext = (ext or "").lower()
-    if _is_safe_ext(ext):
-        return ext
-    return fallback
+_ALLOWED_EXTS = frozenset({".pdf", ".docx", ".png", ".jpg", ".jpeg", ".bin"})
+_DOC_EXTS = frozenset({".pdf", ".docx"})
 
 
-def _is_safe_ext(ext: str) -> bool:
-    return bool(ext) and len(ext) <= 8 and ext.startswith(".") and ext[1:].isalnum()
+def _safe_file_suffix(name: str, fallback: str = ".bin") -> str:
+    ext = os.path.splitext((name or "").strip())[1].lower()
+    return ext if ext in _ALLOWED_EXTS else fallback
 
 
 def _ensure_supported_doc_ext(name: str, field_name: str) -> str:
-    ext = _safe_file_suffix(name or "", fallback="")
-    if ext in {".pdf", ".docx"}:
+    ext = os.path.splitext((name or "").strip())[1].lower()
+    if ext in _DOC_EXTS:
         return ext
     raise HTTPException(
         status_code=422,
@@ -75,11 +91,204 @@ def _ensure_supported_doc_ext(name: str, field_name: str) -> str:
 
 
 async def _save_upload_to_temp(upload: UploadFile, suffix: str = ".bin") -> str:
+    # Stream the spooled upload to disk in 1 MiB chunks off the event loop instead of
+    # materializing the whole payload as bytes first.
     with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        tmp.write(await upload.read())
+        await asyncio.to_thread(shutil.copyfileobj, upload.file, tmp, 1 << 20)
         return tmp.name
 
 
+@dataclass
+class _DocUpload:
+    """A parser input read from its UploadFile exactly once; every extractor reads ``data``."""
+
+    name: str
+    ext: str
+    data: bytes
+
+    def stream(self) -> IO[bytes]:
+        return io.BytesIO(self.data)
+
+
+async def _read_doc_upload(upload: UploadFile, ext: str) -> _DocUpload:
+    return _DocUpload(name=upload.filename or "", ext=ext, data=await upload.read())
+
+
+def _parse_fer_to_dict(fp) -> Dict:
+    with PdfSource(fp) as fer_src:
+        return to_dict(parse_fer_pdf(fer_src))
+
+
+def _parse_fer_upload(fer: _DocUpload) -> Tuple[FerParseResult, Dict[str, str], List[Tuple[str, str]]]:
+    with PdfSource(fer.stream()) as fer_src:
+        return (
+            parse_fer_pdf(fer_src),
+            extract_fer_sections(read_pdf_text(fer_src)),
+            extract_formal_requirements_rows_from_pdf(fer_src),
+        )
+
+
+def _extract_cs_fields(cs: _DocUpload) -> Tuple[str, str, str, str, str]:
+    """Return (title, applicant, background, summary, technical effect) from one parse of the CS."""
+    if cs.ext == ".pdf":
+        with PdfSource(cs.stream()) as cs_src:
+            title = extract_title_from_cs_pdf(cs_src)
+            applicant = extract_applicant_from_cs_pdf(cs_src)
+            background, summary = extract_cs_background_and_summary(cs_src)
+            technical_effect = extract_cs_technical_effect(cs_src)
+    else:
+        cs_src = DocxSource(cs.stream())
+        title = extract_title_from_cs_docx(cs_src)
+        applicant = extract_applicant_from_cs_docx(cs_src)
+        background, summary = extract_cs_background_and_summary_from_docx(cs_src)
+        technical_effect = extract_cs_technical_effect_from_docx(cs_src)
+    return title, applicant, background, summary, technical_effect
+
+
+def _extract_claims_text(claims: Optional[_DocUpload]) -> str:
+    # Claims: PDF/DOCX upload only (no text fallback)
+    if claims is None:
+        return ""
+    if claims.ext == ".pdf":
+        return extract_amended_claims_from_pdf(claims.stream())
+    return extract_amended_claims_from_docx(claims.stream())
+
+
+def _render_reply_docx(**kwargs) -> Tuple[IO[bytes], int]:
+    """Save the reply into a spooled file and return it rewound, with its byte size."""
+    doc = generate_reply_docx(**kwargs)
+    # Spill large replies (embedded diagrams/images) to disk and stream them back
+    # in fixed-size chunks rather than holding a second full copy in memory.
+    out = tempfile.SpooledTemporaryFile(max_size=4 << 20)
+    doc.save(out)
+    size = out.tell()
+    out.seek(0)
+    return out, size
+
+
+def _iter_file_chunks(f, chunk_size: int = 64 << 10) -> Iterator[bytes]:
+    try:
+        while chunk := f.read(chunk_size):
+            yield chunk
+    finally:
+        f.close()
+
+
+_PRIOR_ART_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _prior_art_pool() -> ProcessPoolExecutor:
+    global _PRIOR_ART_POOL
+    if _PRIOR_ART_POOL is None:
+        # The pool is created lazily, after to_thread workers may already be running,
+        # so never fork this process; start workers from a clean interpreter instead.
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        _PRIOR_ART_POOL = ProcessPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, 4),
+            mp_context=multiprocessing.get_context(method),
+        )
+    return _PRIOR_ART_POOL
+
+
+def _discard_prior_art_pool(pool: ProcessPoolExecutor) -> None:
+    """Shut down a broken (or retiring) pool so the next job starts a fresh one."""
+    global _PRIOR_ART_POOL
+    if _PRIOR_ART_POOL is pool:
+        _PRIOR_ART_POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+# (sha256, ext) -> (is_scanned, abstract) for recently parsed prior-art uploads, so a
+# D1 re-uploaded across requests is not parsed again. Oldest entries are evicted first.
+_PRIOR_ART_RESULTS: Dict[Tuple[str, str], Tuple[bool, str]] = {}
+_PRIOR_ART_RESULTS_MAX = 256
+
+
+def _extract_prior_art(prior: _DocUpload) -> Tuple[bool, str]:
+    """Return (is_scanned, abstract) for one prior-art upload; runs in a worker process."""
+    if prior.ext == ".pdf":
+        return scan_and_extract_prior_art_pdf(prior.stream())
+    return False, extract_prior_art_abstract_from_docx(prior.stream())
+
+
+def _remember_prior_art_result(key: Tuple[str, str], result: Tuple[bool, str]) -> None:
+    _PRIOR_ART_RESULTS.pop(key, None)
+    _PRIOR_ART_RESULTS[key] = result
+    while len(_PRIOR_ART_RESULTS) > _PRIOR_ART_RESULTS_MAX:
+        del _PRIOR_ART_RESULTS[next(iter(_PRIOR_ART_RESULTS))]
+
+
+async def _run_prior_art_job(prior: _DocUpload) -> Tuple[bool, str]:
+    """
+    Extract one prior art in the process pool. A pool broken by a dead worker (e.g. an
+    OOM-killed parse) is replaced and the job retried once; if the fresh pool breaks
+    too, the request fails with 503 rather than parsing the file in the server process.
+    """
+    loop = asyncio.get_running_loop()
+    for _ in range(2):
+        pool = _prior_art_pool()
+        try:
+            return await loop.run_in_executor(pool, _extract_prior_art, prior)
+        except BrokenProcessPool:
+            _discard_prior_art_pool(pool)
+    raise HTTPException(
+        status_code=503,
+        detail=f"Prior art file {prior.name or 'upload'} could not be processed; the parser worker exited.",
+    )
+
+
+class _PriorArtJobs(NamedTuple):
+    keys: Dict[int, Tuple[str, str]]
+    cached: Dict[Tuple[str, str], Tuple[bool, str]]
+    pending: Dict[Tuple[str, str], asyncio.Future]
+
+
+async def _start_prior_art_jobs(uploads: List[UploadFile]) -> _PriorArtJobs:
+    """
+    Read every supported prior-art upload and submit the ones not already cached to the
+    process pool. Unsupported uploads are skipped here and rejected, in upload order,
+    by the caller.
+    """
+    jobs = _PriorArtJobs({}, {}, {})
+    try:
+        for i, upload in enumerate(uploads):
+            prior_ext = _safe_file_suffix(upload.filename or "", fallback="")
+            if prior_ext not in _DOC_EXTS:
+                continue
+            prior_doc = await _read_doc_upload(upload, prior_ext)
+            key = (hashlib.sha256(prior_doc.data).hexdigest(), prior_ext)
+            jobs.keys[i] = key
+            if key in jobs.cached or key in jobs.pending:
+                continue
+            if key in _PRIOR_ART_RESULTS:
+                jobs.cached[key] = _PRIOR_ART_RESULTS[key]
+            else:
+                jobs.pending[key] = asyncio.ensure_future(_run_prior_art_job(prior_doc))
+    except BaseException:
+        _cancel_prior_art_jobs(jobs)
+        raise
+    return jobs
+
+
+def _cancel_prior_art_jobs(jobs: _PriorArtJobs) -> None:
+    """Cancel jobs of a request that failed; queued pool work is dropped with them."""
+    for fut in jobs.pending.values():
+        fut.cancel()
+
+
+async def _collect_prior_art_results(jobs: _PriorArtJobs) -> Dict[int, Tuple[bool, str]]:
+    resolved = dict(jobs.cached)
+    try:
+        results = await asyncio.gather(*jobs.pending.values())
+    except BaseException:
+        _cancel_prior_art_jobs(jobs)
+        raise
+    resolved.update(zip(jobs.pending, results))
+    for key, result in resolved.items():
+        _remember_prior_art_result(key, result)
+    return {i: resolved[key] for i, key in jobs.keys.items()}
+
+
 def _normalize_manual_prior_art_entries(raw_entries: List[Dict]) -> List[Dict[str, str]]:
     out: List[Dict[str, str]] = []
     for i, row in enumerate(raw_entries, 1):
@@ -106,14 +315,9 @@ def health():
 
 @app.post("/api/parse_fer")
 async def parse_fer(fer_pdf: UploadFile = File(...)):
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-        tmp.write(await fer_pdf.read())
-        tmp_path = tmp.name
-    try:
-        return JSONResponse(to_dict(parse_fer_pdf(tmp_path)))
-    finally:
-        try: os.remove(tmp_path)
-        except: pass
+    # pdfplumber seeks within the spooled upload file directly, so the FER is parsed
+    # without copying the payload into a bytes object or onto disk first.
+    return JSONResponse(await asyncio.to_thread(_parse_fer_to_dict, fer_pdf.file))
 
 
 @app.post("/api/generate_reply")
@@ -136,71 +340,54 @@ async def generate_reply(
     prior_art_pdf_meta_json: str = Form(""),
     prior_arts_meta_json: str = Form(""),
 ):
-    fer_path = cs_path = claims_path = None
-    prior_art_paths: List[str] = []
     prior_art_diagram_paths: List[str] = []
     technical_effect_image_paths: List[str] = []
     try:
-        fer_path = await _save_upload_to_temp(fer_pdf, suffix=".pdf")
+        # FER, CS, claims and prior-art documents are only read by the parsers, so they
+        # are parsed straight from the uploaded bytes; images still go through temp files.
+        fer_doc = await _read_doc_upload(fer_pdf, ".pdf")
         cs_ext = _ensure_supported_doc_ext(cs_pdf.filename or "", "CS document")
-        cs_path = await _save_upload_to_temp(cs_pdf, suffix=cs_ext)
+        cs_doc = await _read_doc_upload(cs_pdf, cs_ext)
 
-        claims_ext = ""
+        claims_doc = None
         if amended_claims_pdf:
             claims_ext = _ensure_supported_doc_ext(amended_claims_pdf.filename or "", "Amended Claims document")
-            claims_path = await _save_upload_to_temp(amended_claims_pdf, suffix=claims_ext)
+            claims_doc = await _read_doc_upload(amended_claims_pdf, claims_ext)
 
-        fer = parse_fer_pdf(fer_path)
-        fer_raw = read_pdf_text(fer_path)
-        detailed_obs = extract_detailed_observations_block(fer_raw)
-        formal_reqs  = extract_formal_requirements_block(fer_raw)
-        formal_rows = extract_formal_requirements_rows_from_pdf(fer_path)
-
-        # Title must come from CS (cover sheet).
-        if cs_ext == ".pdf":
-            cs_title = extract_title_from_cs_pdf(cs_path)
-        else:
-            cs_title = extract_title_from_cs_docx(cs_path)
+        mode = (prior_art_input_mode or prior_art_mode or "pdf").strip().lower()
+        pdf_list = list(prior_art_pdfs or []) if mode != "text" else []
+
+        # Parsing and rendering are synchronous CPU work, so they run off the event loop.
+        # The FER, CS, claims and prior-art pipelines are independent until the reply is
+        # rendered: prior-art jobs go to the process pool first, then the rest run
+        # concurrently in worker threads.
+        prior_jobs = await _start_prior_art_jobs(pdf_list)
+        try:
+            (fer, fer_sections, formal_rows), cs_fields, claims_text = await asyncio.gather(
+                asyncio.to_thread(_parse_fer_upload, fer_doc),
+                asyncio.to_thread(_extract_cs_fields, cs_doc),
+                asyncio.to_thread(_extract_claims_text, claims_doc),
+            )
+        except BaseException:
+            # Don't leave the pool parsing prior arts for a request that already failed.
+            _cancel_prior_art_jobs(prior_jobs)
+            raise
+        detailed_obs = fer_sections["detailed_obs"]
+        formal_reqs  = fer_sections["formal_reqs"]
+
+        # Title and applicant must come from CS (cover sheet).
+        cs_title, cs_applicant, cs_background, cs_summary, cs_technical_effect = cs_fields
         if not cs_title:
             cs_title = fer.title or ""
-
-        # Applicant must come from CS when available.
-        if cs_ext == ".pdf":
-            cs_applicant = extract_applicant_from_cs_pdf(cs_path)
-        else:
-            cs_applicant = extract_applicant_from_cs_docx(cs_path)
         if cs_applicant:
             fer.applicant = cs_applicant
 
-        if cs_ext == ".pdf":
-            cs_background, cs_summary = extract_cs_background_and_summary(cs_path)
-            cs_technical_effect = extract_cs_technical_effect(cs_path)
-        else:
-            cs_background, cs_summary = extract_cs_background_and_summary_from_docx(cs_path)
-            cs_technical_effect = extract_cs_technical_effect_from_docx(cs_path)
-
-        # Claims: PDF only (no text fallback)
-        claims_text = ""
-        if claims_path:
-            if claims_ext == ".pdf":
-                claims_text = extract_amended_claims_from_pdf(claims_path)
-            else:
-                claims_text = extract_amended_claims_from_docx(claims_path)
-
         prior_art_entries: List[Dict[str, str]] = []
-        mode = (prior_art_input_mode or prior_art_mode or "pdf").strip().lower()
-
-        manual_json_raw = prior_arts_json if (prior_arts_json or "").strip() else prior_art_manual_json
-        pdf_meta_json_raw = prior_arts_meta_json if (prior_arts_meta_json or "").strip() else prior_art_pdf_meta_json
-
-        pdf_meta_rows = _safe_json_list(pdf_meta_json_raw)
-        meta_by_upload_name: Dict[str, Dict] = {}
-        for row in pdf_meta_rows:
-            upload_name = clean_prior_art_text(str(row.get("upload_name", "")))
-            if upload_name and upload_name not in meta_by_upload_name:
-                meta_by_upload_name[upload_name] = row
 
+        # The client sends each payload under both the current and the legacy field
+        # name; only the one the selected mode needs is parsed, preferring the current name.
         if mode == "text":
+            manual_json_raw = prior_arts_json if (prior_arts_json or "").strip() else prior_art_manual_json
             manual_rows = _safe_json_list(manual_json_raw)
             dia_iter = iter(list(prior_art_diagrams or []))
             for i, row in enumerate(manual_rows, 1):
@@ -234,44 +421,56 @@ async def generate_reply(
                     }
                 )
         else:
-            pdf_list = list(prior_art_pdfs or [])
+            pdf_meta_json_raw = prior_arts_meta_json if (prior_arts_meta_json or "").strip() else prior_art_pdf_meta_json
+
+            # Clean the metadata once into index-aligned columns; the upload loop below
+            # resolves a row index (by upload name, else position) and reads them directly.
+            meta_labels: List[str] = []
+            meta_diagrams: List[str] = []
+            meta_has_diagrams: List[bool] = []
+            meta_idx_by_upload_name: Dict[str, int] = {}
+            for idx, row in enumerate(_safe_json_list(pdf_meta_json_raw)):
+                diagram = clean_prior_art_text(str(row.get("diagram", "")))
+                meta_labels.append(str(row.get("label", "")))
+                meta_diagrams.append(diagram)
+                meta_has_diagrams.append(bool(row.get("has_diagram", False)) or bool(diagram))
+                upload_name = clean_prior_art_text(str(row.get("upload_name", "")))
+                if upload_name and upload_name not in meta_idx_by_upload_name:
+                    meta_idx_by_upload_name[upload_name] = idx
+            meta_count = len(meta_labels)
+
             dia_list = list(prior_art_diagrams or [])
             dia_iter = iter(dia_list)
-            total_rows = max(len(pdf_meta_rows), len(pdf_list), len(dia_list))
+            total_rows = max(meta_count, len(pdf_list), len(dia_list))
+
+            prior_results = await _collect_prior_art_results(prior_jobs)
+
             for i in range(total_rows):
                 upload = pdf_list[i] if i < len(pdf_list) else None
 
-                row = {}
-                if upload is not None:
-                    row = meta_by_upload_name.get(upload.filename or "") or {}
-                if not row and i < len(pdf_meta_rows):
-                    row = pdf_meta_rows[i]
+                idx = meta_idx_by_upload_name.get(upload.filename or "", i) if upload is not None else i
+                has_meta = idx < meta_count
 
-                label = normalize_prior_art_label(str(row.get("label", "")), i + 1)
-                diagram = clean_prior_art_text(str(row.get("diagram", "")))
+                label = normalize_prior_art_label(meta_labels[idx] if has_meta else "", i + 1)
+                diagram = meta_diagrams[idx] if has_meta else ""
                 diagram_path = ""
                 abstract = ""
                 source_name = ""
 
                 if upload is not None:
                     source_name = clean_prior_art_text(upload.filename or "")
-                    prior_ext = _ensure_supported_doc_ext(upload.filename or "", f"Prior art file {source_name or label}")
-                    prior_path = await _save_upload_to_temp(upload, suffix=prior_ext)
-                    prior_art_paths.append(prior_path)
-                    if prior_ext == ".pdf":
-                        if is_scanned_prior_art_pdf(prior_path):
-                            display_name = source_name or label
-                            raise HTTPException(
-                                status_code=422,
-                                detail=f"{display_name} is a scanned copy (image-only PDF). Please provide text copy PDF.",
-                            )
-                        abstract = extract_prior_art_abstract_from_pdf(prior_path)
-                    else:
-                        abstract = extract_prior_art_abstract_from_docx(prior_path)
-
-                has_diagram = bool(row.get("has_diagram", False)) or bool(diagram)
+                    _ensure_supported_doc_ext(upload.filename or "", f"Prior art file {source_name or label}")
+                    scanned, abstract = prior_results[i]
+                    if scanned:
+                        display_name = source_name or label
+                        raise HTTPException(
+                            status_code=422,
+                            detail=f"{display_name} is a scanned copy (image-only PDF). Please provide text copy PDF.",
+                        )
+
+                has_diagram = has_meta and meta_has_diagrams[idx]
                 diagram_upload = next(dia_iter, None) if has_diagram else None
-                if diagram_upload is None and not pdf_meta_rows and i < len(dia_list):
+                if diagram_upload is None and not meta_count and i < len(dia_list):
                     # Backward fallback when per-row metadata is absent.
                     diagram_upload = dia_list[i]
 
@@ -302,7 +501,8 @@ async def generate_reply(
             img_path = await _save_upload_to_temp(img, suffix=ext)
             technical_effect_image_paths.append(img_path)
 
-        doc = generate_reply_docx(
+        out, out_size = await asyncio.to_thread(
+            _render_reply_docx,
             fer=fer, cs_title=cs_title, amended_claims=claims_text,
             detailed_obs_text=detailed_obs, formal_reqs_text=formal_reqs,
             agent=agent, office_address=office_address,
@@ -314,16 +514,16 @@ async def generate_reply(
             cs_technical_effect_text=cs_technical_effect,
             technical_effect_image_paths=technical_effect_image_paths,
         )
-
-        bio = io.BytesIO()
-        doc.save(bio)
-        bio.seek(0)
         filename = f"FER_Reply_Draft_{fer.application_no or 'UNKNOWN'}.docx"
-        return StreamingResponse(bio,
-            media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            headers={"Content-Disposition": f'attachment; filename="{filename}"'})
+        return StreamingResponse(_iter_file_chunks(out),
+            media_type=_DOCX_MEDIA_TYPE,
+            headers={
+                "Content-Disposition": f'attachment; filename="{filename}"',
+                "Content-Length": str(out_size),
+                "Content-Encoding": "identity",
+            })
     finally:
-        for p in [fer_path, cs_path, claims_path, *prior_art_paths, *prior_art_diagram_paths, *technical_effect_image_paths]:
+        for p in [*prior_art_diagram_paths, *technical_effect_image_paths]:
             if p:
                 try: os.remove(p)
                 except: pass
@@ -1,12 +1,30 @@
+import io
 import json
 
 import requests
 import streamlit as st
+from PIL import Image, ImageOps
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 st.set_page_config(page_title="FER Reply Generator", page_icon="DOC", layout="wide")
 
 BACKEND = st.sidebar.text_input("Backend URL", "http://127.0.0.1:8000")
 
+# One pooled session per browser session, so Parse and Generate clicks reuse the
+# backend connection instead of reconnecting on every request.
+if "http" not in st.session_state:
+    _http = requests.Session()
+    # POSTs are only retried on connection failures (urllib3 never replays a POST
+    # after the request was sent), which covers a cold or restarting backend.
+    _adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                           max_retries=Retry(total=2, backoff_factor=0.2))
+    _http.mount("http://", _adapter)
+    _http.mount("https://", _adapter)
+    _http.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip"})
+    st.session_state.http = _http
+http = st.session_state.http
+
 st.title("FER Reply Generator")
 st.caption("Upload FER PDF + CS/Claims documents (PDF or DOCX) to auto-generate the reply DOCX with objections pre-filled.")
 
@@ -23,6 +41,12 @@ technical_effect_image_uploads = []
 prior_art_complete = True
 
 
+_EXT_MIME = {
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+
 def _error_message(resp: requests.Response) -> str:
     try:
         payload = resp.json()
@@ -36,17 +60,56 @@ def _error_message(resp: requests.Response) -> str:
     return text or f"Request failed with status {resp.status_code}"
 
 
+def _add_prior_art() -> None:
+    st.session_state.prior_art_count += 1
+
+
 def _upload_tuple(upload, fallback_name: str, fallback_mime: str):
     name = (getattr(upload, "name", "") or fallback_name).strip() or fallback_name
     mime = (getattr(upload, "type", "") or "").strip()
     if not mime:
-        if name.lower().endswith(".docx"):
-            mime = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-        elif name.lower().endswith(".pdf"):
-            mime = "application/pdf"
-        else:
-            mime = fallback_mime
-    return (name, upload.getvalue(), mime)
+        _, dot, ext = name.rpartition(".")
+        mime = _EXT_MIME.get(ext.lower(), fallback_mime) if dot else fallback_mime
+    # Hand requests the UploadedFile itself (a BytesIO) so it reads the buffer once
+    # while encoding the body, instead of copying it out with getvalue() first.
+    upload.seek(0)
+    return (name, upload, mime)
+
+
+_IMAGE_MAX_PX = 1600
+_IMAGE_SAVE_OPTS = {"JPEG": {"quality": 85, "optimize": True}, "PNG": {"optimize": True}}
+# Pillow reports most phone photos (multi-picture JPEGs) as "MPO"; re-save those as plain JPEG.
+_IMAGE_SAVE_FORMAT = {"JPEG": "JPEG", "MPO": "JPEG", "PNG": "PNG"}
+
+
+def _shrink_image(img):
+    """Return (bytes, mime) for an image downscaled to _IMAGE_MAX_PX, or None to send it as-is."""
+    try:
+        img.seek(0)
+        with Image.open(img) as im:
+            fmt = _IMAGE_SAVE_FORMAT.get(im.format)
+            if fmt is None or max(im.size) <= _IMAGE_MAX_PX:
+                return None
+            # Bake in the EXIF rotation, since the re-encoded copy drops the tag.
+            small = ImageOps.exif_transpose(im)
+            small.thumbnail((_IMAGE_MAX_PX, _IMAGE_MAX_PX))
+            buf = io.BytesIO()
+            small.save(buf, format=fmt, **_IMAGE_SAVE_OPTS[fmt])
+    except Exception:
+        return None
+    return buf.getvalue(), Image.MIME[fmt]
+
+
+def _image_tuple(img, seen: dict, shrunk: dict):
+    # The reply embeds images at ~5.8in, so anything past 1600px is wasted upload.
+    # Results are kept per uploaded file so repeated Generate clicks skip the re-encode.
+    key = (getattr(img, "file_id", None) or img.name, img.size)
+    small = seen[key] if key in seen else _shrink_image(img)
+    shrunk[key] = small
+    if small is not None:
+        return (img.name, small[0], small[1])
+    img.seek(0)
+    return (img.name, img, img.type or "application/octet-stream")
 
 
 with col_left:
@@ -74,9 +137,10 @@ with col_left:
     )
     prior_art_input_mode = "pdf" if prior_art_input_mode_label.startswith("From Prior-Art Document") else "text"
 
-    if st.button("+ Add Prior Art", use_container_width=True, key="add_prior_art"):
-        st.session_state.prior_art_count += 1
-        st.rerun()
+    # The callback runs before the rerun triggered by the click, so the new entry is
+    # drawn in that same pass rather than forcing a second full script run.
+    st.button("+ Add Prior Art", use_container_width=True, key="add_prior_art",
+              on_click=_add_prior_art)
 
     for idx in range(max(1, st.session_state.prior_art_count)):
         default_label = f"D{idx + 1}"
@@ -158,10 +222,11 @@ col1, col2 = st.columns(2)
 
 with col1:
     if st.button("Parse FER (Preview JSON)", disabled=fer_file is None):
+        fer_file.seek(0)
         with st.spinner("Parsing FER..."):
-            r = requests.post(
+            r = http.post(
                 f"{BACKEND}/api/parse_fer",
-                files={"fer_pdf": ("fer.pdf", fer_file.getvalue(), "application/pdf")},
+                files={"fer_pdf": (fer_file.name, fer_file, "application/pdf")},
             )
         if r.status_code != 200:
             st.error(_error_message(r))
@@ -174,52 +239,54 @@ with col2:
         st.warning("Please complete CS document, Amended Claims document, and Prior Arts (D1-Dn) to generate the reply.")
 
     if st.button("Generate FER Reply DOCX", disabled=generate_disabled, type="primary"):
+        # The FER uploader only accepts PDFs, so its part skips the _upload_tuple MIME fallback.
+        fer_file.seek(0)
+        files = [
+            ("fer_pdf", (fer_file.name, fer_file, "application/pdf")),
+            ("cs_pdf", _upload_tuple(cs_file, "cs.pdf", "application/pdf")),
+            ("amended_claims_pdf", _upload_tuple(claims_pdf, "claims.pdf", "application/pdf")),
+        ]
+        for pdf in prior_art_pdf_uploads:
+            if pdf is not None:
+                files.append(("prior_art_pdfs", _upload_tuple(pdf, "prior_art.pdf", "application/pdf")))
+        prior_arts_meta = []
+        prior_arts_text_payload = []
+        for entry in prior_arts_entries:
+            label = entry.get("label", "")
+            has_diagram = bool(entry.get("has_diagram", False))
+            prior_arts_meta.append({"label": label, "has_diagram": has_diagram})
+            prior_arts_text_payload.append(
+                {"label": label, "abstract": entry.get("abstract", ""), "has_diagram": has_diagram}
+            )
+        # Serialize each payload once; the backward-compatible aliases reuse the same blobs.
+        meta_blob = json.dumps(prior_arts_meta, ensure_ascii=True, separators=(",", ":"))
+        text_blob = json.dumps(prior_arts_text_payload, ensure_ascii=True, separators=(",", ":"))
+        data = {
+            "title": "",
+            "agent": agent or "",
+            "office_address": office_address,
+            "dx_range": dx_range,
+            "dx_disclosed_features": dx_disclosed_features,
+            "prior_art_input_mode": prior_art_input_mode,
+            "prior_arts_meta_json": meta_blob,
+            "prior_arts_json": text_blob,
+            # Backward-compatible aliases for the existing backend contract.
+            "prior_art_mode": prior_art_input_mode,
+            "prior_art_pdf_meta_json": meta_blob,
+            "prior_art_manual_json": text_blob,
+        }
         with st.spinner("Generating DOCX..."):
-            files = [
-                ("fer_pdf", _upload_tuple(fer_file, "fer.pdf", "application/pdf")),
-                ("cs_pdf", _upload_tuple(cs_file, "cs.pdf", "application/pdf")),
-                ("amended_claims_pdf", _upload_tuple(claims_pdf, "claims.pdf", "application/pdf")),
-            ]
-            for pdf in prior_art_pdf_uploads:
-                if pdf is not None:
-                    files.append(("prior_art_pdfs", _upload_tuple(pdf, "prior_art.pdf", "application/pdf")))
+            # Downscaling large images can take a moment, so it runs under the spinner.
+            seen_images = st.session_state.get("shrunk_images", {})
+            shrunk_images = {}
             for img in prior_art_diagram_uploads:
                 if img is not None:
-                    files.append(("prior_art_diagrams", (img.name, img.getvalue(), img.type or "application/octet-stream")))
+                    files.append(("prior_art_diagrams", _image_tuple(img, seen_images, shrunk_images)))
             for img in technical_effect_image_uploads:
                 if img is not None:
-                    files.append(("technical_effect_images", (img.name, img.getvalue(), img.type or "application/octet-stream")))
-
-            prior_arts_meta = [
-                {
-                    "label": entry.get("label", ""),
-                    "has_diagram": bool(entry.get("has_diagram", False)),
-                }
-                for entry in prior_arts_entries
-            ]
-            prior_arts_text_payload = [
-                {
-                    "label": entry.get("label", ""),
-                    "abstract": entry.get("abstract", ""),
-                    "has_diagram": bool(entry.get("has_diagram", False)),
-                }
-                for entry in prior_arts_entries
-            ]
-            data = {
-                "title": "",
-                "agent": agent or "",
-                "office_address": office_address,
-                "dx_range": dx_range,
-                "dx_disclosed_features": dx_disclosed_features,
-                "prior_art_input_mode": prior_art_input_mode,
-                "prior_arts_meta_json": json.dumps(prior_arts_meta, ensure_ascii=True),
-                "prior_arts_json": json.dumps(prior_arts_text_payload, ensure_ascii=True),
-                # Backward-compatible aliases for the existing backend contract.
-                "prior_art_mode": prior_art_input_mode,
-                "prior_art_pdf_meta_json": json.dumps(prior_arts_meta, ensure_ascii=True),
-                "prior_art_manual_json": json.dumps(prior_arts_text_payload, ensure_ascii=True),
-            }
-            r = requests.post(f"{BACKEND}/api/generate_reply", files=files, data=data)
+                    files.append(("technical_effect_images", _image_tuple(img, seen_images, shrunk_images)))
+            st.session_state.shrunk_images = shrunk_images
+            r = http.post(f"{BACKEND}/api/generate_reply", files=files, data=data)
 
         if r.status_code != 200:
             st.error(_error_message(r))